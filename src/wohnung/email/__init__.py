@@ -2,22 +2,120 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
 import re
-from collections import defaultdict
+import sys
+from collections import Counter, defaultdict
 from datetime import datetime
-from typing import TYPE_CHECKING
+from itertools import groupby
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from markupsafe import Markup, escape
 
 from wohnung.change_detector import ApartmentChange
 from wohnung.config import settings
 from wohnung.models import Flat, ScraperResult
 
-try:
-    import resend  # type: ignore[import-untyped]
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+_RESEND_API_URL = "https://api.resend.com/emails"
+
+
+async def _post_email(client: httpx.AsyncClient, api_key: str, payload: bytes) -> str:
+    """Post a JSON-encoded email to the Resend API and return its ID."""
+    response = await client.post(
+        _RESEND_API_URL,
+        content=payload,
+        headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+    )
+    response.raise_for_status()
+    return str(response.json().get("id", "N/A"))
+
+
+async def _post_one(
+    client: httpx.AsyncClient, api_key: str, recipient_email: str, shared_fields: bytes
+) -> tuple[bool, str]:
+    """Send the email from one account, returning the outcome and its report line."""
+    # Only the recipient is encoded per account; shared_fields closes the object
+    payload = b'{"to":%s,%s' % (json.dumps([recipient_email]).encode(), shared_fields)
+    try:
+        email_id = await _post_email(client, api_key, payload)
+    except Exception as e:
+        return False, f"❌ Error sending email to {recipient_email}: {e}\n"
+
+    return True, f"📧 Email sent to {recipient_email}\n   Email ID: {email_id}\n"
+
+
+async def _send_all(
+    keys_by_recipient: dict[str, str], body: dict[str, Any]
+) -> list[tuple[bool, str]]:
+    """Send to all recipients concurrently over one client."""
+    # Serialize the shared fields, including the large HTML, a single time
+    shared_fields = json.dumps(body).encode()[1:]
+    async with httpx.AsyncClient(timeout=settings.request_timeout) as client:
+        return await asyncio.gather(
+            *(
+                _post_one(client, api_key, recipient, shared_fields)
+                for recipient, api_key in keys_by_recipient.items()
+            )
+        )
+
+
+async def _send_single(api_key: str, params: dict[str, Any]) -> str:
+    """Send one email with a short-lived client and return its ID."""
+    async with httpx.AsyncClient(timeout=settings.request_timeout) as client:
+        return await _post_email(client, api_key, json.dumps(params).encode())
+
+
+def _send_to_accounts(accounts: list[tuple[str, str]], subject: str, html_content: str) -> bool:
+    """Send the same email from each account to its registered recipient.
+
+    The body is assembled and JSON-encoded once; only the recipient is
+    encoded per account.
+    All requests are in flight at the same time, so the total wait is one
+    round trip to the Resend API rather than one per account. Accounts that
+    share a recipient are collapsed so each address gets a single email,
+    sent with the first API key registered for it.
+
+    Args:
+        accounts: List of (api_key, recipient_email) tuples
+        subject: Email subject
+        html_content: Rendered HTML body
+
+    Returns:
+        True if all emails were sent successfully
+    """
+    keys_by_recipient: dict[str, str] = {}
+    for api_key, recipient_email in accounts:
+        keys_by_recipient.setdefault(recipient_email, api_key)
+
+    body = {"from": settings.email_from, "subject": subject, "html": html_content}
+    results = asyncio.run(_send_all(keys_by_recipient, body))
+
+    # Report all accounts with a single write
+    sys.stdout.write("".join(line for _, line in results))
+    sys.stdout.flush()
+    return all(ok for ok, _ in results)
+
+
+def _plural(count: int, singular: str, plural: str) -> str:
+    """Pick the singular or plural suffix for a count."""
+    return singular if count == 1 else plural
+
 
-    RESEND_AVAILABLE = True
-except ImportError:
-    RESEND_AVAILABLE = False
-    resend = None  # type: ignore[assignment]
+def _changes_subject(new_count: int, updated_count: int) -> str:
+    """Build the subject fragment for new/updated apartment counts."""
+    parts = []
+    if new_count:
+        parts.append(f"{new_count} neue")
+    if updated_count:
+        parts.append(f"{updated_count} aktualisierte")
+    suffix = "en" if new_count + updated_count > 1 else ""
+    return f"{' und '.join(parts).capitalize()} Wohnung{suffix}"
 
 
 def generate_email_html(flats: list[Flat]) -> str:
@@ -30,78 +128,7 @@ def generate_email_html(flats: list[Flat]) -> str:
     Returns:
         HTML string
     """
-    html = """
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <style>
-        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
-               line-height: 1.6; color: #333; background: #f5f5f5; padding: 20px; }
-        .container { max-width: 800px; margin: 0 auto; background: white;
-                     border-radius: 8px; padding: 30px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-        h1 { color: #2c3e50; margin-bottom: 30px; }
-        .flat { border: 1px solid #e0e0e0; border-radius: 8px; padding: 20px;
-                margin-bottom: 20px; transition: transform 0.2s; }
-        .flat:hover { transform: translateY(-2px); box-shadow: 0 4px 8px rgba(0,0,0,0.1); }
-        .flat-title { font-size: 20px; font-weight: 600; margin-bottom: 12px; color: #2c3e50; }
-        .flat-details { display: flex; gap: 20px; margin-bottom: 12px; flex-wrap: wrap; }
-        .flat-detail { color: #666; font-size: 14px; }
-        .flat-detail strong { color: #2c3e50; }
-        .flat-link { display: inline-block; background: #3498db; color: white !important;
-                     padding: 12px 24px; text-decoration: none; border-radius: 6px;
-                     margin-top: 12px; font-weight: 500; }
-        .flat-link:hover { background: #2980b9; }
-        .flat-image { max-width: 100%; height: auto; border-radius: 6px; margin-bottom: 12px; }
-        .meta { font-size: 12px; color: #999; margin-top: 12px; padding-top: 12px;
-                border-top: 1px solid #eee; }
-    </style>
-</head>
-<body>
-    <div class="container">
-"""
-
-    plural = "en" if len(flats) != 1 else "e"
-    html += f"        <h1>🏠 {len(flats)} Neu{plural} Wohnung{plural} gefunden!</h1>\n"
-
-    for flat in flats:
-        markers_html = ""
-        if flat.markers:
-            markers_html = '<div style="margin-bottom: 12px;">'
-            for marker in flat.markers:
-                markers_html += f'<span class="badge" style="background: #16a085; color: white; display: inline-block; padding: 4px 8px; border-radius: 4px; font-size: 12px; font-weight: 600; margin-right: 8px;">🏷️ {marker}</span>'
-            markers_html += "</div>"
-
-        html += f"""
-        <div class="flat">
-            {f'<img class="flat-image" src="{flat.image_url}" alt="{flat.title}" />' if flat.image_url else ''}
-            <div class="flat-title">{flat.title}</div>
-            {markers_html}
-            <div class="flat-details">
-"""
-
-        if flat.price:
-            html += f'                <span class="flat-detail"><strong>💰 Preis:</strong> €{flat.price:.0f}</span>\n'
-        if flat.size:
-            html += f'                <span class="flat-detail"><strong>📐 Größe:</strong> {flat.size}m²</span>\n'
-        if flat.rooms:
-            html += f'                <span class="flat-detail"><strong>🚪 Zimmer:</strong> {flat.rooms}</span>\n'
-
-        html += f"""            </div>
-            <div class="flat-detail"><strong>📍 Standort:</strong> {flat.location}</div>
-            {f'<p style="color: #666; margin-top: 12px;">{flat.description[:200]}...</p>' if flat.description else ''}
-            <a class="flat-link" href="{flat.url}" target="_blank">Anzeige ansehen →</a>
-            <div class="meta">
-                Quelle: {flat.source} | Gefunden: {flat.found_at.strftime('%d.%m.%Y %H:%M')}
-            </div>
-        </div>
-"""
-
-    html += """    </div>
-</body>
-</html>
-"""
-    return html
+    return _get_template("flats.html.j2").render(flats=flats, plural=_plural(len(flats), "e", "en"))
 
 
 def send_email(flats: list[Flat], dry_run: bool = False) -> bool:
@@ -120,10 +147,10 @@ def send_email(flats: list[Flat], dry_run: bool = False) -> bool:
         True if all emails were sent successfully
 
     Raises:
-        RuntimeError: If Resend is not installed
         ValueError: If no API key is configured
     """
-    if len(flats) == 0:
+    count = len(flats)
+    if count == 0:
         print("📭 No new flats to send")
         return True
 
@@ -134,42 +161,16 @@ def send_email(flats: list[Flat], dry_run: bool = False) -> bool:
         )
 
     if dry_run:
-        print(
-            f"📧 [DRY RUN] Would send email about {len(flats)} flats to: {settings.email_recipients}"
-        )
+        # Reuse the accounts already read instead of rescanning the environment
+        recipients = [email for _, email in accounts]
+        print(f"📧 [DRY RUN] Would send email about {count} flats to: {recipients}")
         return True
 
-    if not RESEND_AVAILABLE or resend is None:
-        raise RuntimeError("Resend package is not installed. Install with: pip install resend")
-
-    plural = "s" if len(flats) != 1 else ""
-    subject = f"🏠 {len(flats)} Neu{plural} Wohnung{plural} gefunden!"
+    plural = _plural(count, "", "s")
+    subject = f"🏠 {count} Neu{plural} Wohnung{plural} gefunden!"
     html_content = generate_email_html(flats)
 
-    all_success = True
-
-    # Send email from each account to its registered email
-    for api_key, recipient_email in accounts:
-        try:
-            # Set API key for this account
-            resend.api_key = api_key
-
-            params = {
-                "from": settings.email_from,
-                "to": [recipient_email],
-                "subject": subject,
-                "html": html_content,
-            }
-
-            response = resend.Emails.send(params)
-            print(f"📧 Email sent to {recipient_email}")
-            print(f"   Email ID: {response.get('id', 'N/A')}")
-
-        except Exception as e:
-            print(f"❌ Error sending email to {recipient_email}: {e}")
-            all_success = False
-
-    return all_success
+    return _send_to_accounts(accounts, subject, html_content)
 
 
 __all__ = [
@@ -181,316 +182,93 @@ __all__ = [
 ]
 
 
-def _get_html_styles() -> str:
-    """Get CSS styles for email templates."""
-    return """
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background: #f5f5f5;
-            padding: 20px;
-            margin: 0;
-        }
-        .container {
-            max-width: 800px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 8px;
-            padding: 30px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        h1 {
-            color: #2c3e50;
-            margin-bottom: 10px;
-        }
-        h2 {
-            color: #34495e;
-            margin-top: 30px;
-            margin-bottom: 15px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #ecf0f1;
-        }
-        .summary {
-            background: #ecf0f1;
-            padding: 15px;
-            border-radius: 6px;
-            margin-bottom: 25px;
-            font-size: 14px;
-        }
-        .summary-item {
-            display: inline-block;
-            margin-right: 20px;
-        }
-        .badge {
-            display: inline-block;
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-size: 12px;
-            font-weight: 600;
-            margin-right: 8px;
-        }
-        .badge-new {
-            background: #2ecc71;
-            color: white;
-        }
-        .badge-updated {
-            background: #3498db;
-            color: white;
-        }
-        .badge-removed {
-            background: #95a5a6;
-            color: white;
-        }
-        .badge-price-drop {
-            background: #e74c3c;
-            color: white;
-        }
-        .badge-price-up {
-            background: #f39c12;
-            color: white;
-        }
-        .badge-marker-high {
-            background: #9b59b6;
-            color: white;
-        }
-        .badge-marker-medium {
-            background: #16a085;
-            color: white;
-        }
-        .badge-marker-low {
-            background: #7f8c8d;
-            color: white;
-        }
-        .flat {
-            border: 1px solid #e0e0e0;
-            border-radius: 8px;
-            padding: 20px;
-            margin-bottom: 20px;
-            transition: transform 0.2s;
-            background: white;
-        }
-        .flat:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }
-        .flat-header {
-            display: flex;
-            align-items: center;
-            margin-bottom: 12px;
-        }
-        .flat-title {
-            font-size: 20px;
-            font-weight: 600;
-            color: #2c3e50;
-            flex: 1;
-        }
-        .flat-details {
-            display: flex;
-            gap: 20px;
-            margin-bottom: 12px;
-            flex-wrap: wrap;
-        }
-        .flat-detail {
-            color: #666;
-            font-size: 14px;
-        }
-        .flat-detail strong {
-            color: #2c3e50;
-        }
-        .change-highlight {
-            background: #fff3cd;
-            border-left: 4px solid #ffc107;
-            padding: 12px;
-            margin: 12px 0;
-            border-radius: 4px;
-        }
-        .change-item {
-            margin: 6px 0;
-            font-size: 14px;
-        }
-        .change-arrow {
-            color: #666;
-            font-weight: bold;
-            margin: 0 8px;
-        }
-        .old-value {
-            text-decoration: line-through;
-            color: #999;
-        }
-        .new-value {
-            color: #27ae60;
-            font-weight: 600;
-        }
-        .flat-link {
-            display: inline-block;
-            background: #3498db;
-            color: white !important;
-            padding: 12px 24px;
-            text-decoration: none;
-            border-radius: 6px;
-            margin-top: 12px;
-            font-weight: 500;
-        }
-        .flat-link:hover {
-            background: #2980b9;
-        }
-        .flat-image {
-            max-width: 100%;
-            height: auto;
-            border-radius: 6px;
-            margin-bottom: 12px;
-        }
-        .meta {
-            font-size: 12px;
-            color: #999;
-            margin-top: 12px;
-            padding-top: 12px;
-            border-top: 1px solid #eee;
-        }
-        .site-section {
-            margin-bottom: 30px;
-        }
-        .site-header {
-            background: #34495e;
-            color: white;
-            padding: 12px 16px;
-            border-radius: 6px;
-            margin-bottom: 15px;
-            font-weight: 600;
-        }
-    """
-
-
-def _format_price_change(old_price: float, new_price: float) -> str:
+def _format_price_change(old_price: float, new_price: float) -> Markup:
     """Format price change with indicator."""
+    if new_price == old_price:
+        return Markup("")
+    # One signed percentage; the "+" format spec renders the sign for both directions
+    percentage = (new_price - old_price) * 100.0 / old_price
     if new_price < old_price:
-        diff = old_price - new_price
-        percentage = (diff / old_price) * 100
-        return f'<span class="badge badge-price-drop">💰 Price Drop: -{percentage:.1f}%</span>'
-    if new_price > old_price:
-        diff = new_price - old_price
-        percentage = (diff / old_price) * 100
-        return f'<span class="badge badge-price-up">📈 Price Up: +{percentage:.1f}%</span>'
-    return ""
-
-
-def _render_change_highlight(change: ApartmentChange) -> str:
-    """Render change highlights for an updated apartment."""
-    if not change.changes:
-        return ""
-
-    html = '        <div class="change-highlight">\n'
-    html += "            <strong>📝 Was hat sich geändert:</strong>\n"
-
-    for field, (old_val, new_val) in change.changes.items():
-        if field == "price":
-            html += '            <div class="change-item">'
-            html += f'💰 Preis: <span class="old-value">€{old_val:.0f}</span>'
-            html += '<span class="change-arrow">→</span>'
-            html += f'<span class="new-value">€{new_val:.0f}</span>'
-            html += "</div>\n"
-        elif field == "size":
-            html += '            <div class="change-item">'
-            html += f'📐 Größe: <span class="old-value">{old_val}m²</span>'
-            html += '<span class="change-arrow">→</span>'
-            html += f'<span class="new-value">{new_val}m²</span>'
-            html += "</div>\n"
-        elif field == "rooms":
-            html += '            <div class="change-item">'
-            html += f'🚪 Zimmer: <span class="old-value">{old_val}</span>'
-            html += '<span class="change-arrow">→</span>'
-            html += f'<span class="new-value">{new_val}</span>'
-            html += "</div>\n"
-        elif field == "title":
-            html += '            <div class="change-item">📝 Titel wurde aktualisiert</div>\n'
-        elif field == "description":
-            html += (
-                '            <div class="change-item">📄 Beschreibung wurde aktualisiert</div>\n'
-            )
-        else:
-            html += f'            <div class="change-item">{field.title()}: '
-            html += f'<span class="old-value">{old_val}</span>'
-            html += '<span class="change-arrow">→</span>'
-            html += f'<span class="new-value">{new_val}</span>'
-            html += "</div>\n"
-
-    html += "        </div>\n"
-    return html
+        return Markup(
+            f'<span class="badge badge-price-drop">💰 Price Drop: {percentage:+.1f}%</span>'
+        )
+    return Markup(f'<span class="badge badge-price-up">📈 Price Up: {percentage:+.1f}%</span>')
+
+
+def _format_timestamp(d: datetime) -> str:
+    """Format a timestamp as DD.MM.YYYY HH:MM without going through strftime."""
+    return f"{d.day:02d}.{d.month:02d}.{d.year} {d.hour:02d}:{d.minute:02d}"
+
+
+def _excerpt(text: str, limit: int = 200) -> str:
+    """Shorten text to limit characters, marking it with "..." only if it was cut."""
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}..."
+
+
+# Change-highlight rows by field; values are escaped by Markup.format
+_CHANGE_ITEM_FORMATS: dict[str, Markup] = {
+    "price": Markup(
+        '<div class="change-item">💰 Preis: <span class="old-value">€{old:.0f}</span>'
+        '<span class="change-arrow">→</span><span class="new-value">€{new:.0f}</span></div>'
+    ),
+    "size": Markup(
+        '<div class="change-item">📐 Größe: <span class="old-value">{old}m²</span>'
+        '<span class="change-arrow">→</span><span class="new-value">{new}m²</span></div>'
+    ),
+    "rooms": Markup(
+        '<div class="change-item">🚪 Zimmer: <span class="old-value">{old}</span>'
+        '<span class="change-arrow">→</span><span class="new-value">{new}</span></div>'
+    ),
+    "title": Markup('<div class="change-item">📝 Titel wurde aktualisiert</div>'),
+    "description": Markup('<div class="change-item">📄 Beschreibung wurde aktualisiert</div>'),
+}
+_DEFAULT_CHANGE_ITEM_FORMAT = Markup(
+    '<div class="change-item">{label}: <span class="old-value">{old}</span>'
+    '<span class="change-arrow">→</span><span class="new-value">{new}</span></div>'
+)
+
+
+def _format_change_item(field: str, old_value: Any, new_value: Any) -> Markup:
+    """Format one changed field for the change highlight box."""
+    fmt = _CHANGE_ITEM_FORMATS.get(field)
+    if fmt is None:
+        return _DEFAULT_CHANGE_ITEM_FORMAT.format(label=field.title(), old=old_value, new=new_value)
+    return fmt.format(old=old_value, new=new_value)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_env() -> Environment:
+    """Create the template environment on first render.
+
+    Jinja2 is imported here so that senders which never render a template
+    (e.g. the consolidated email) do not pay for it at import time.
+    Autoescape covers the ".html.j2" files.
+    """
+    from jinja2 import Environment, PackageLoader, select_autoescape  # noqa: PLC0415
+
+    env = Environment(
+        loader=PackageLoader("wohnung.email", "templates"),
+        autoescape=select_autoescape(["html", "html.j2"]),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+    )
+    env.globals["format_price_change"] = _format_price_change
+    env.globals["format_change_item"] = _format_change_item
+    env.filters["timestamp"] = _format_timestamp
+    env.filters["excerpt"] = _excerpt
+    return env
 
 
-def _render_apartment_card(  # noqa: C901, PLR0912
-    change: ApartmentChange, show_changes: bool = True
-) -> str:
-    """Render an apartment card with optional change highlights."""
-    data = change.apartment_data
-    html = '        <div class="flat">\n'
-
-    # Header with badges
-    html += '            <div class="flat-header">\n'
-    if change.change_type == "new":
-        html += '                <span class="badge badge-new">🆕 NEW</span>\n'
-    elif change.change_type == "updated":
-        html += '                <span class="badge badge-updated">📝 UPDATED</span>\n'
-        # Add price change indicator
-        if "price" in change.changes:
-            old_price, new_price = change.changes["price"]
-            html += f"                {_format_price_change(old_price, new_price)}\n"
-
-    # Add marker badges if present
-    markers = data.get("markers", [])
-    if markers:
-        for marker in markers:
-            # Use medium priority styling by default
-            html += f'                <span class="badge badge-marker-medium">🏷️ {marker}</span>\n'
-
-    html += "            </div>\n"
-
-    # Image
-    if data.get("image_url"):
-        html += f'            <img class="flat-image" src="{data["image_url"]}" alt="{data.get("title", "Apartment")}" />\n'
-
-    # Title
-    html += f'            <div class="flat-title">{data.get("title", "Unknown")}</div>\n'
-
-    # Change highlights (for updates)
-    if show_changes and change.change_type == "updated":
-        html += _render_change_highlight(change)
-
-    # Details
-    html += '            <div class="flat-details">\n'
-    if data.get("price"):
-        html += f'                <span class="flat-detail"><strong>💰 Preis:</strong> €{data["price"]:.0f}</span>\n'
-    if data.get("size"):
-        html += f'                <span class="flat-detail"><strong>📐 Größe:</strong> {data["size"]}m²</span>\n'
-    if data.get("rooms"):
-        html += f'                <span class="flat-detail"><strong>🚪 Zimmer:</strong> {data["rooms"]}</span>\n'
-    html += "            </div>\n"
-
-    if data.get("location"):
-        html += f'            <div class="flat-detail"><strong>📍 Standort:</strong> {data["location"]}</div>\n'
-
-    # Description
-    if data.get("description"):
-        desc = data["description"][:200]
-        html += f'            <p style="color: #666; margin-top: 12px;">{desc}...</p>\n'
-
-    # Link
-    if data.get("url"):
-        html += f'            <a class="flat-link" href="{data["url"]}" target="_blank">Anzeige ansehen →</a>\n'
-
-    # Meta
-    source = data.get("source", "Unbekannt")
-    timestamp = change.timestamp.strftime("%d.%m.%Y %H:%M")
-    html += '            <div class="meta">\n'
-    html += f"                Quelle: {source} | Erkannt: {timestamp}\n"
-    html += "            </div>\n"
-
-    html += "        </div>\n"
-    return html
+@functools.cache
+def _get_template(name: str) -> Template:
+    """Load and compile a template on first use."""
+    return _get_env().get_template(name)
 
 
-def generate_changes_email_html(  # noqa: C901, PLR0912
+def generate_changes_email_html(
     changes: list[ApartmentChange],
     group_by_site: bool = True,
     include_removed: bool = False,
@@ -505,88 +283,42 @@ def generate_changes_email_html(  # noqa: C901, PLR0912
     Returns:
         HTML string
     """
-    # Filter changes
-    if not include_removed:
-        changes = [c for c in changes if c.change_type != "removed"]
+    # Partition by change type in a single pass
+    new_changes: list[ApartmentChange] = []
+    updated_changes: list[ApartmentChange] = []
+    removed_changes: list[ApartmentChange] = []
+    buckets = {"new": new_changes, "updated": updated_changes, "removed": removed_changes}
+    for change in changes:
+        buckets[change.change_type].append(change)
 
-    new_changes = [c for c in changes if c.change_type == "new"]
-    updated_changes = [c for c in changes if c.change_type == "updated"]
-    removed_changes = [c for c in changes if c.change_type == "removed"]
-
-    # Start HTML
-    html = """<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <style>"""
-    html += _get_html_styles()
-    html += """
-    </style>
-</head>
-<body>
-    <div class="container">
-"""
-
-    # Title
-    total = len(new_changes) + len(updated_changes)
-    html += f"        <h1>🏠 {total} Wohnungs-Update{'s' if total != 1 else ''}</h1>\n"
-
-    # Summary
-    html += '        <div class="summary">\n'
-    if new_changes:
-        html += f'            <span class="summary-item">🆕 <strong>{len(new_changes)}</strong> Neu</span>\n'
-    if updated_changes:
-        html += f'            <span class="summary-item">📝 <strong>{len(updated_changes)}</strong> Aktualisiert</span>\n'
-    if removed_changes and include_removed:
-        html += f'            <span class="summary-item">🗑️ <strong>{len(removed_changes)}</strong> Entfernt</span>\n'
-    html += "        </div>\n"
+    if not include_removed:
+        changes = new_changes + updated_changes
 
+    sites: list[tuple[str, list[ApartmentChange], list[ApartmentChange]]] | None = None
     if group_by_site:
-        # Group by site
-        changes_by_site: dict[str, list[ApartmentChange]] = defaultdict(list)
-        for change in changes:
-            site = change.apartment_data.get("source", "Unknown")
-            changes_by_site[site].append(change)
-
-        # Render each site
-        for site, site_changes in sorted(changes_by_site.items()):
-            site_new = [c for c in site_changes if c.change_type == "new"]
-            site_updated = [c for c in site_changes if c.change_type == "updated"]
-
-            html += '        <div class="site-section">\n'
-            html += f'            <div class="site-header">📍 {site}</div>\n'
-
-            # New apartments
-            if site_new:
-                html += "            <h2>🆕 Neue Wohnungen</h2>\n"
-                for change in site_new:
-                    html += _render_apartment_card(change, show_changes=False)
-
-            # Updated apartments
-            if site_updated:
-                html += "            <h2>📝 Aktualisierte Wohnungen</h2>\n"
-                for change in site_updated:
-                    html += _render_apartment_card(change, show_changes=True)
-
-            html += "        </div>\n"
-    else:
-        # Render without grouping
-        if new_changes:
-            html += "        <h2>🆕 Neue Wohnungen</h2>\n"
-            for change in new_changes:
-                html += _render_apartment_card(change, show_changes=False)
-
-        if updated_changes:
-            html += "        <h2>📝 Aktualisierte Wohnungen</h2>\n"
-            for change in updated_changes:
-                html += _render_apartment_card(change, show_changes=True)
-
-    # Footer
-    html += """    </div>
-</body>
-</html>
-"""
-    return html
+        # Group by site, splitting each group while it is consumed
+        def site_of(change: ApartmentChange) -> str:
+            return str(change.apartment_data.get("source", "Unknown"))
+
+        sites = []
+        for site, site_changes in groupby(sorted(changes, key=site_of), key=site_of):
+            site_new: list[ApartmentChange] = []
+            site_updated: list[ApartmentChange] = []
+            site_buckets = {"new": site_new, "updated": site_updated}
+            for change in site_changes:
+                bucket = site_buckets.get(change.change_type)
+                if bucket is not None:
+                    bucket.append(change)
+            sites.append((site, site_new, site_updated))
+
+    return _get_template("changes.html.j2").render(
+        total=len(new_changes) + len(updated_changes),
+        new_changes=new_changes,
+        updated_changes=updated_changes,
+        removed_changes=removed_changes,
+        include_removed=include_removed,
+        sites=sites,
+    )
 
 
 def send_changes_email(
@@ -594,6 +326,7 @@ def send_changes_email(
     dry_run: bool = False,
     group_by_site: bool = True,
     include_removed: bool = False,
+    prerendered_html: str | None = None,
 ) -> bool:
     """Send email notification for apartment changes.
 
@@ -606,24 +339,25 @@ def send_changes_email(
         dry_run: If True, only print what would be sent
         group_by_site: Whether to group apartments by site
         include_removed: Whether to include removed apartments
+        prerendered_html: HTML already rendered for these changes (e.g. by
+            preview_changes_email); skips rendering it again
 
     Returns:
         True if all emails were sent successfully
 
     Raises:
-        RuntimeError: If Resend is not installed
         ValueError: If no API key is configured
     """
-    # Filter significant changes
-    significant = [c for c in changes if c.change_type in ("new", "updated")]
+    # Count significant changes in one pass
+    counts = Counter(c.change_type for c in changes)
+    new_count = counts["new"]
+    updated_count = counts["updated"]
+    significant_count = new_count + updated_count
 
-    if not significant:
+    if not significant_count:
         print("📭 No significant changes to notify about")
         return True
 
-    new_count = len([c for c in significant if c.change_type == "new"])
-    updated_count = len([c for c in significant if c.change_type == "updated"])
-
     accounts = settings.email_accounts
     if not accounts:
         raise ValueError(
@@ -634,50 +368,19 @@ def send_changes_email(
         print(
             f"📧 [DRY RUN] Would send email about {new_count} new and {updated_count} updated apartments"
         )
-        print(f"    Recipients: {settings.email_recipients}")
+        print(f"    Recipients: {[email for _, email in accounts]}")
         return True
 
-    if not RESEND_AVAILABLE or resend is None:
-        raise RuntimeError("Resend package is not installed. Install with: pip install resend")
-
-    # Generate subject
-    parts = []
-    if new_count:
-        parts.append(f"{new_count} neue")
-    if updated_count:
-        parts.append(f"{updated_count} aktualisierte")
-
-    subject = f"🏠 {' und '.join(parts).capitalize()} Wohnung{'en' if len(significant) > 1 else ''}"
-
-    # Generate HTML
-    html_content = generate_changes_email_html(
-        changes, group_by_site=group_by_site, include_removed=include_removed
-    )
-
-    all_success = True
-
-    # Send email from each account to its registered email
-    for api_key, recipient_email in accounts:
-        try:
-            # Set API key for this account
-            resend.api_key = api_key
-
-            params = {
-                "from": settings.email_from,
-                "to": [recipient_email],
-                "subject": subject,
-                "html": html_content,
-            }
-
-            response = resend.Emails.send(params)
-            print(f"📧 Email sent to {recipient_email}")
-            print(f"   Email ID: {response.get('id', 'N/A')}")
+    subject = f"🏠 {_changes_subject(new_count, updated_count)}"
 
-        except Exception as e:
-            print(f"❌ Error sending email to {recipient_email}: {e}")
-            all_success = False
+    # Generate HTML unless the caller already rendered it
+    html_content = prerendered_html
+    if html_content is None:
+        html_content = generate_changes_email_html(
+            changes, group_by_site=group_by_site, include_removed=include_removed
+        )
 
-    return all_success
+    return _send_to_accounts(accounts, subject, html_content)
 
 
 def preview_changes_email(
@@ -697,14 +400,15 @@ def preview_changes_email(
     """
     html = generate_changes_email_html(changes, group_by_site=group_by_site)
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(html)
+    # Encode once and write the bytes in one go
+    with open(output_file, "wb") as f:
+        f.write(html.encode("utf-8"))
 
     print(f"📄 Email preview saved to: {output_file}")
     return output_file
 
 
-def send_consolidated_email(  # noqa: C901
+def send_consolidated_email(
     changes: list[ApartmentChange],
     scraper_results: list[ScraperResult],  # List of ScraperResult
     dry_run: bool = False,
@@ -725,13 +429,12 @@ def send_consolidated_email(  # noqa: C901
         True if all emails were sent successfully
 
     Raises:
-        RuntimeError: If Resend is not installed
         ValueError: If no API key is configured
     """
-    # Filter significant changes
-    significant = [c for c in changes if c.change_type in ("new", "updated")]
-    new_count = len([c for c in significant if c.change_type == "new"])
-    updated_count = len([c for c in significant if c.change_type == "updated"])
+    # Count significant changes in one pass
+    counts = Counter(c.change_type for c in changes)
+    new_count = counts["new"]
+    updated_count = counts["updated"]
 
     # Check scraper health
     unhealthy_scrapers = [r for r in scraper_results if r.needs_attention]
@@ -751,20 +454,12 @@ def send_consolidated_email(  # noqa: C901
         print(f"    - {healthy_count}/{total_scrapers} healthy scrapers")
         if unhealthy_scrapers:
             print(f"    - ⚠️  {len(unhealthy_scrapers)} scrapers need attention")
-        print(f"    Recipients: {settings.email_recipients}")
+        print(f"    Recipients: {[email for _, email in accounts]}")
         return True
 
-    if not RESEND_AVAILABLE or resend is None:
-        raise RuntimeError("Resend package is not installed. Install with: pip install resend")
-
     # Generate subject with health status
-    subject_parts = []
     if new_count or updated_count:
-        if new_count:
-            subject_parts.append(f"{new_count} neue")
-        if updated_count:
-            subject_parts.append(f"{updated_count} aktualisierte")
-        subject = f"🏠 {' und '.join(subject_parts).capitalize()} Wohnung{'en' if len(significant) > 1 else ''}"
+        subject = f"🏠 {_changes_subject(new_count, updated_count)}"
     else:
         subject = "🏠 Wohnung Scraper Status"
 
@@ -778,33 +473,10 @@ def send_consolidated_email(  # noqa: C901
         scraper_results=scraper_results,
     )
 
-    all_success = True
+    return _send_to_accounts(accounts, subject, html_content)
 
-    # Send email from each account to its registered email
-    for api_key, recipient_email in accounts:
-        try:
-            # Set API key for this account
-            resend.api_key = api_key
-
-            params = {
-                "from": settings.email_from,
-                "to": [recipient_email],
-                "subject": subject,
-                "html": html_content,
-            }
-
-            response = resend.Emails.send(params)
-            print(f"📧 Email sent to {recipient_email}")
-            print(f"   Email ID: {response.get('id', 'N/A')}")
-
-        except Exception as e:
-            print(f"❌ Error sending email to {recipient_email}: {e}")
-            all_success = False
-
-    return all_success
 
-
-def send_scraper_specific_email(  # noqa: C901, PLR0912
+def send_scraper_specific_email(
     scraper_name: str,
     changes: list[ApartmentChange],
     scraper_result: ScraperResult,  # ScraperResult
@@ -829,16 +501,15 @@ def send_scraper_specific_email(  # noqa: C901, PLR0912
         True if email was sent successfully
 
     Raises:
-        RuntimeError: If Resend is not installed
         ValueError: If no API key is configured or no recipients specified
     """
     if not recipients:
         raise ValueError(f"No recipients specified for {scraper_name}")
 
-    # Filter significant changes
-    significant = [c for c in changes if c.change_type in ("new", "updated")]
-    new_count = len([c for c in significant if c.change_type == "new"])
-    updated_count = len([c for c in significant if c.change_type == "updated"])
+    # Count significant changes in one pass
+    counts = Counter(c.change_type for c in changes)
+    new_count = counts["new"]
+    updated_count = counts["updated"]
 
     accounts = settings.email_accounts
     if not accounts:
@@ -854,17 +525,9 @@ def send_scraper_specific_email(  # noqa: C901, PLR0912
         print(f"    Recipients: {recipients}")
         return True
 
-    if not RESEND_AVAILABLE or resend is None:
-        raise RuntimeError("Resend package is not installed. Install with: pip install resend")
-
     # Generate subject with scraper name
-    subject_parts = []
     if new_count or updated_count:
-        if new_count:
-            subject_parts.append(f"{new_count} neue")
-        if updated_count:
-            subject_parts.append(f"{updated_count} aktualisierte")
-        subject = f"🏠 [{scraper_name.upper()}] {' und '.join(subject_parts).capitalize()} Wohnung{'en' if len(significant) > 1 else ''}"
+        subject = f"🏠 [{scraper_name.upper()}] {_changes_subject(new_count, updated_count)}"
     else:
         subject = f"🏠 [{scraper_name.upper()}] Status Update"
 
@@ -884,15 +547,14 @@ def send_scraper_specific_email(  # noqa: C901, PLR0912
     api_key = accounts[0][0]  # Default to first API key
 
     # Try to find matching account for recipient
+    recipient_set = set(recipients)
     for account_key, account_email in accounts:
-        if any(recipient == account_email for recipient in recipients):
+        if account_email in recipient_set:
             api_key = account_key
             break
 
     # Send to all specified recipients
     try:
-        resend.api_key = api_key
-
         params = {
             "from": settings.email_from,
             "to": recipients,
@@ -900,9 +562,9 @@ def send_scraper_specific_email(  # noqa: C901, PLR0912
             "html": html_content,
         }
 
-        response = resend.Emails.send(params)
+        email_id = asyncio.run(_send_single(api_key, params))
         print(f"📧 [{scraper_name}] Email sent to {', '.join(recipients)}")
-        print(f"   Email ID: {response.get('id', 'N/A')}")
+        print(f"   Email ID: {email_id}")
 
     except Exception as e:
         print(f"❌ Error sending {scraper_name} email to {recipients}: {e}")
@@ -911,6 +573,19 @@ def send_scraper_specific_email(  # noqa: C901, PLR0912
     return all_success
 
 
+_MARKER_PREFIX = '                    <span class="marker">'
+_MARKER_SUFFIX = "</span>\n"
+
+
+def _snapshot_flat(change: ApartmentChange) -> Flat:
+    """Build a Flat from a change snapshot without re-validating it.
+
+    Snapshots are dumped from Flats that were validated when scraped, so
+    parsing every URL again just to render the email is wasted work.
+    """
+    return Flat.model_construct(**change.apartment_data)
+
+
 def generate_consolidated_email_html(  # noqa: C901, PLR0912, PLR0915
     changes: list[ApartmentChange],
     scraper_results: list[ScraperResult],  # List of ScraperResult
@@ -933,10 +608,10 @@ def generate_consolidated_email_html(  # noqa: C901, PLR0912, PLR0915
     updated_by_site = defaultdict(list)
 
     for change in new_changes:
-        new_by_site[change.apartment.source].append(change)
+        new_by_site[change.apartment_data["source"]].append(change)
 
     for change in updated_changes:
-        updated_by_site[change.apartment.source].append(change)
+        updated_by_site[change.apartment_data["source"]].append(change)
 
     # Check scraper health
     healthy_scrapers = [r for r in scraper_results if r.is_healthy]
@@ -1036,15 +711,19 @@ def generate_consolidated_email_html(  # noqa: C901, PLR0912, PLR0915
         html += f"<h2>🆕 Neue Wohnungen ({len(new_changes)})</h2>"
 
         for site, site_changes in sorted(new_by_site.items()):
-            html += f"<h3>{site} ({len(site_changes)} neue)</h3>"
+            html += f"<h3>{escape(site)} ({len(site_changes)} neue)</h3>"
 
             for change in site_changes:
-                apt = change.apartment
+                apt = _snapshot_flat(change)
+                # Scraped fields are untrusted: escape each once per card
+                title = escape(apt.title)
+                location = escape(apt.location)
+                url = escape(apt.url)
                 html += f"""
             <div class="flat new">
-                <div class="flat-title">{apt.title}</div>
+                <div class="flat-title">{title}</div>
                 <div class="flat-details">
-                    <div class="flat-detail"><strong>📍 Lage:</strong> {apt.location}</div>
+                    <div class="flat-detail"><strong>📍 Lage:</strong> {location}</div>
 """
                 if apt.price:
                     html += f'                    <div class="flat-detail"><strong>💰 Preis:</strong> €{apt.price:.2f}</div>\n'
@@ -1056,13 +735,17 @@ def generate_consolidated_email_html(  # noqa: C901, PLR0912, PLR0915
                 html += "                </div>\n"
 
                 if apt.markers:
-                    html += '                <div class="markers">\n'
-                    for marker in apt.markers:
-                        html += f'                    <span class="marker">{marker}</span>\n'
-                    html += "                </div>\n"
+                    html += (
+                        '                <div class="markers">\n'
+                        + "".join(
+                            f"{_MARKER_PREFIX}{escape(marker)}{_MARKER_SUFFIX}"
+                            for marker in apt.markers
+                        )
+                        + "                </div>\n"
+                    )
 
                 html += f"""
-                <a href="{apt.url}" class="flat-link">Details ansehen →</a>
+                <a href="{url}" class="flat-link">Details ansehen →</a>
             </div>
 """
 
@@ -1071,22 +754,25 @@ def generate_consolidated_email_html(  # noqa: C901, PLR0912, PLR0915
         html += f"<h2>🔄 Aktualisierte Wohnungen ({len(updated_changes)})</h2>"
 
         for site, site_changes in sorted(updated_by_site.items()):
-            html += f"<h3>{site} ({len(site_changes)} aktualisiert)</h3>"
+            html += f"<h3>{escape(site)} ({len(site_changes)} aktualisiert)</h3>"
 
             for change in site_changes:
-                apt = change.apartment
-                changes_text = (
+                apt = _snapshot_flat(change)
+                title = escape(apt.title)
+                location = escape(apt.location)
+                url = escape(apt.url)
+                changes_text = escape(
                     ", ".join(change.changed_fields) if change.changed_fields else "Änderungen"
                 )
 
                 html += f"""
             <div class="flat updated">
-                <div class="flat-title">{apt.title}</div>
+                <div class="flat-title">{title}</div>
                 <div class="flat-detail" style="color: #3498db; margin-bottom: 10px;">
                     <strong>Geändert:</strong> {changes_text}
                 </div>
                 <div class="flat-details">
-                    <div class="flat-detail"><strong>📍 Lage:</strong> {apt.location}</div>
+                    <div class="flat-detail"><strong>📍 Lage:</strong> {location}</div>
 """
                 if apt.price:
                     html += f'                    <div class="flat-detail"><strong>💰 Preis:</strong> €{apt.price:.2f}</div>\n'
@@ -1096,7 +782,7 @@ def generate_consolidated_email_html(  # noqa: C901, PLR0912, PLR0915
                     html += f'                    <div class="flat-detail"><strong>🛏️ Zimmer:</strong> {apt.rooms}</div>\n'
 
                 html += f"""                </div>
-                <a href="{apt.url}" class="flat-link">Details ansehen →</a>
+                <a href="{url}" class="flat-link">Details ansehen →</a>
             </div>
 """
 
@@ -1112,12 +798,12 @@ def generate_consolidated_email_html(  # noqa: C901, PLR0912, PLR0915
             html += "<h3>❌ Failed Scrapers (benötigen Update)</h3>"
             for result in failed_scrapers:
                 error_msgs = "<br>".join(
-                    f'<div class="error-message">• {e}</div>' for e in result.errors
+                    f'<div class="error-message">• {escape(e)}</div>' for e in result.errors
                 )
                 html += f"""
             <div class="scraper-item failed">
                 <div>
-                    <span class="scraper-name">{result.source}</span>
+                    <span class="scraper-name">{escape(result.source)}</span>
                     <div class="scraper-count">0 Wohnungen gefunden</div>
                     {error_msgs}
                 </div>
@@ -1130,12 +816,12 @@ def generate_consolidated_email_html(  # noqa: C901, PLR0912, PLR0915
             html += "<h3>⚠️ Unhealthy Scrapers (prüfen empfohlen)</h3>"
             for result in unhealthy_scrapers:
                 warning_msgs = "<br>".join(
-                    f'<div class="warning-message">• {w}</div>' for w in result.warnings
+                    f'<div class="warning-message">• {escape(w)}</div>' for w in result.warnings
                 )
                 html += f"""
             <div class="scraper-item unhealthy">
                 <div>
-                    <span class="scraper-name">{result.source}</span>
+                    <span class="scraper-name">{escape(result.source)}</span>
                     <div class="scraper-count">{len(result.flats)} Wohnungen gefunden</div>
                     {warning_msgs}
                 </div>
@@ -1,14 +1,35 @@
 """Main entry point for the scraper."""
 
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from wohnung.config import settings
-from wohnung.models import Flat
-from wohnung.scrapers import deduplicate_flats, get_scrapers, run_all_scrapers
+from wohnung.models import Flat, ScraperResult
 from wohnung.site_storage import SiteStorage
 
 
+def _add_unique_flats(
+    result: ScraperResult,
+    seen_ids: set[str],
+    flats_by_site: dict[str, list[Flat]],
+) -> None:
+    """
+    Add a scraper's flats to the per-site lists, skipping IDs already seen.
+
+    Deduplicating while grouping means the flats are walked once, with no
+    combined list of all flats and no second deduplication per site.
+
+    Args:
+        result: Scraper result whose flats to add
+        seen_ids: IDs added so far; updated in place
+        flats_by_site: Unique flats grouped by source site; updated in place
+    """
+    for flat in result.flats:
+        if flat.id not in seen_ids:
+            seen_ids.add(flat.id)
+            flats_by_site[flat.source].append(flat)
+
+
 def main(dry_run: bool = False) -> int:
     """
     Main scraping function.
@@ -35,55 +56,59 @@ def main(dry_run: bool = False) -> int:
             legacy_file.rename(settings.data_dir / "flats.json.backup")
             print("   ✅ Migration complete")
 
-        # Run all scrapers
-        results = run_all_scrapers()
+        # Imported here so the scraper modules and their parsers are only
+        # loaded once a run actually starts
+        from wohnung.scrapers import get_scrapers, run_all_scrapers
+        from wohnung.scrapers.base import create_http_client
+
+        # Run all scrapers over one shared HTTP client, keeping the instances
+        # for the per-scraper email settings below
+        with create_http_client() as client:
+            scrapers = get_scrapers(client)
+            results = run_all_scrapers(scrapers)
 
-        # Organize flats by source site
+        # Deduplicate and organize flats by source site in one pass
         flats_by_site: dict[str, list[Flat]] = defaultdict(list)
-        all_flats = []
+        seen_ids: set[str] = set()
+        total_flats = 0
 
         for result in results:
-            all_flats.extend(result.flats)
-            for flat in result.flats:
-                site = flat.source or "unknown"
-                flats_by_site[site].append(flat)
+            total_flats += len(result.flats)
+            _add_unique_flats(result, seen_ids, flats_by_site)
 
         print("\n📊 Summary:")
-        print(f"   Total flats found: {len(all_flats)}")
-
-        # Deduplicate
-        unique_flats = deduplicate_flats(all_flats)
-        print(f"   Unique flats: {len(unique_flats)}")
+        print(f"   Total flats found: {total_flats}")
+        print(f"   Unique flats: {len(seen_ids)}")
 
         # Process each site and track detailed changes
         from wohnung.change_detector import ApartmentChange
 
-        all_changes: list[ApartmentChange] = []
-
-        for site_name, flats in flats_by_site.items():
-            # Deduplicate within site
-            site_flats = deduplicate_flats(flats)
+        # Index changes by (source, change type) and count them per site in a
+        # single pass; every count and per-source list below is read from these
+        changes_index: dict[tuple[str, str], list[ApartmentChange]] = defaultdict(list)
+        type_counts: Counter[str] = Counter()
 
+        for site_name, site_flats in flats_by_site.items():
             # Save and get detailed changes
             changes = storage.save_apartments_with_changes(site_name, site_flats)
 
             if changes:
-                new = [c for c in changes if c.change_type == "new"]
-                updated = [c for c in changes if c.change_type == "updated"]
-                removed = [c for c in changes if c.change_type == "removed"]
+                site_counts: Counter[str] = Counter()
+                for change in changes:
+                    site_counts[change.change_type] += 1
+                    key = (change.apartment_data.get("source", ""), change.change_type)
+                    changes_index[key].append(change)
+                type_counts.update(site_counts)
 
                 print(f"\n   📍 {site_name}:")
-                msg = f"      New: {len(new)}, "
-                msg += f"Updated: {len(updated)}, "
-                msg += f"Removed: {len(removed)}"
+                msg = f"      New: {site_counts['new']}, "
+                msg += f"Updated: {site_counts['updated']}, "
+                msg += f"Removed: {site_counts['removed']}"
                 print(msg)
 
-                all_changes.extend(changes)
-
-        # Count changes
-        new_count = len([c for c in all_changes if c.change_type == "new"])
-        updated_count = len([c for c in all_changes if c.change_type == "updated"])
-        removed_count = len([c for c in all_changes if c.change_type == "removed"])
+        new_count = type_counts["new"]
+        updated_count = type_counts["updated"]
+        removed_count = type_counts["removed"]
 
         print(f"\n   Total NEW: {new_count}")
         print(f"   Total UPDATED: {updated_count}")
@@ -102,37 +127,44 @@ def main(dry_run: bool = False) -> int:
 
         # Separate changes and results by scraper type
         # Special scrapers (like nordwestbahnhof) have custom email recipients
-        scrapers = get_scrapers()  # Get scraper instances to check email_recipients
         special_changes = {}  # source -> changes
         special_results = {}  # source -> result
         regular_changes = []
         regular_results = []
+        regular_new = 0
+        regular_updated = 0
+
+        # Look up results and scrapers by name; reversed so the first entry wins
+        results_by_source = {r.source: r for r in reversed(results)}
+        scrapers_by_name = {s.name: s for s in reversed(scrapers)}
 
         for scraper_instance in scrapers:
+            source = scraper_instance.name
+            source_new_changes = changes_index.get((source, "new"), [])
+            source_updated_changes = changes_index.get((source, "updated"), [])
+            source_changes = [
+                *source_new_changes,
+                *source_updated_changes,
+                *changes_index.get((source, "removed"), []),
+            ]
+            source_result = results_by_source.get(source)
+
             if scraper_instance.email_recipients is not None:
                 # Special scraper with custom email recipients
-                source = scraper_instance.name
-                source_changes = [c for c in all_changes if c.apartment.source == source]
-                source_result = next((r for r in results if r.source == source), None)
-
                 if source_changes or (source_result and source_result.needs_attention):
                     special_changes[source] = source_changes
                     if source_result:
                         special_results[source] = source_result
             else:
                 # Regular scraper - goes to consolidated email
-                source = scraper_instance.name
-                source_changes = [c for c in all_changes if c.apartment.source == source]
-                source_result = next((r for r in results if r.source == source), None)
-
                 regular_changes.extend(source_changes)
+                regular_new += len(source_new_changes)
+                regular_updated += len(source_updated_changes)
                 if source_result:
                     regular_results.append(source_result)
 
         # Send consolidated email for regular scrapers
         # Only send if there are actual apartment changes (new or updated)
-        regular_new = len([c for c in regular_changes if c.change_type == "new"])
-        regular_updated = len([c for c in regular_changes if c.change_type == "updated"])
         regular_unhealthy = [r for r in regular_results if r.needs_attention]
 
         if regular_new > 0 or regular_updated > 0:
@@ -162,8 +194,8 @@ def main(dry_run: bool = False) -> int:
             source_result = special_results.get(source)
 
             # Check if there are any new or updated apartments
-            source_new = len([c for c in source_changes if c.change_type == "new"])
-            source_updated = len([c for c in source_changes if c.change_type == "updated"])
+            source_new = len(changes_index.get((source, "new"), ()))
+            source_updated = len(changes_index.get((source, "updated"), ()))
 
             if source_new == 0 and source_updated == 0:
                 print(f"\n✅ {source}: No changes detected, no email sent")
@@ -173,7 +205,7 @@ def main(dry_run: bool = False) -> int:
             from wohnung.email import send_scraper_specific_email
 
             # Get the scraper instance to get custom recipients
-            scraper_inst = next((s for s in scrapers if s.name == source), None)
+            scraper_inst = scrapers_by_name.get(source)
             if not scraper_inst:
                 print(f"⚠️  Could not find scraper instance for {source}")
                 continue
@@ -1,11 +1,19 @@
 """Marker detection for apartment listings."""
 
 import re
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from wohnung.models import Flat
 from wohnung.site_config import MarkerConfig
 
+try:
+    import ahocorasick
+except ImportError:  # Optional speedup: pip install "wohnung-scraper[fast-markers]"
+    ahocorasick = None
+
+# Which fields a marker searches: (title, description)
+_SearchKey = tuple[bool, bool]
+
 
 class MarkerDetector:
     """Detects markers in apartment listings."""
@@ -18,7 +26,95 @@ class MarkerDetector:
         Args:
             markers: List of marker configurations
         """
-        self.markers = sorted(markers, key=lambda m: self.PRIORITY_ORDER[m.priority])
+        # Decorate with (priority, position) so the sort compares plain tuples
+        # and keeps configuration order within a priority
+        priority_order = self.PRIORITY_ORDER
+        decorated = [(priority_order[m.priority], i, m) for i, m in enumerate(markers)]
+        decorated.sort()
+        self.markers = [marker for _, _, marker in decorated]
+        # First marker wins for duplicate names, matching the priority-ordered scan
+        self._by_name: dict[str, MarkerConfig] = {}
+        for marker in self.markers:
+            self._by_name.setdefault(marker.name, marker)
+
+        # Patterns are classified and compiled once, not for every apartment.
+        # With pyahocorasick installed, the plain substrings of all markers go
+        # into one automaton that scans the text once; otherwise they are
+        # escaped into each marker's regex.
+        automaton = ahocorasick.Automaton() if ahocorasick is not None else None
+        self._substring_keys: set[_SearchKey] = set()
+        self._compiled: list[tuple[MarkerConfig, _SearchKey, list[re.Pattern[str]]]] = []
+
+        for index, marker in enumerate(self.markers):
+            key = ("title" in marker.search_in, "description" in marker.search_in)
+            sources = []
+            for pattern in marker.patterns:
+                pattern_lower, is_regex = self._classify_pattern(pattern)
+                if is_regex:
+                    sources.append(pattern_lower)
+                elif automaton is not None and pattern_lower:
+                    self._add_substring(automaton, pattern_lower, index)
+                    self._substring_keys.add(key)
+                else:
+                    sources.append(re.escape(pattern_lower))
+            self._compiled.append((marker, key, self._compile_sources(sources)))
+
+        self._automaton: Any = None
+        if automaton is not None and len(automaton):
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    @staticmethod
+    def _classify_pattern(pattern: str) -> tuple[str, bool]:
+        """Lowercase a marker pattern and decide how to match it.
+
+        Args:
+            pattern: Marker pattern (plain substring or regex)
+
+        Returns:
+            Tuple of (lowercased pattern, whether it is a valid regex)
+        """
+        pattern_lower = pattern.lower()
+
+        # Check if pattern looks like regex (contains regex special chars)
+        if any(char in pattern for char in r"^$.*+?[]{}()\|"):
+            try:
+                re.compile(pattern_lower)
+                return pattern_lower, True
+            except re.error:
+                # Invalid regex, use exact match as fallback
+                pass
+        return pattern_lower, False
+
+    @staticmethod
+    def _add_substring(automaton: Any, pattern_lower: str, index: int) -> None:
+        """Register a substring for the marker at index in the automaton."""
+        indices = automaton.get(pattern_lower, None)
+        if indices is None:
+            automaton.add_word(pattern_lower, [index])
+        else:
+            indices.append(index)
+
+    @staticmethod
+    def _compile_sources(sources: list[str]) -> list[re.Pattern[str]]:
+        """Compile a marker's regex sources into a single alternation.
+
+        One combined regex scans the text once instead of once per pattern.
+        If the patterns cannot be combined (e.g. one sets global inline flags),
+        they are compiled separately.
+
+        Args:
+            sources: Regex sources for the marker's patterns
+
+        Returns:
+            Compiled patterns to search; usually at most one
+        """
+        if not sources:
+            return []
+        try:
+            return [re.compile("|".join(f"(?:{source})" for source in sources), re.IGNORECASE)]
+        except re.error:
+            return [re.compile(source, re.IGNORECASE) for source in sources]
 
     def detect_markers(self, apartment: Flat) -> list[str]:
         """Detect which markers apply to an apartment.
@@ -32,54 +128,41 @@ class MarkerDetector:
         Returns:
             List of detected marker names
         """
-        detected = []
-
-        for marker in self.markers:
-            if self._matches_marker(apartment, marker):
-                detected.append(marker.name)
-
-        return detected
-
-    def _matches_marker(self, apartment: Flat, marker: MarkerConfig) -> bool:
-        """Check if apartment matches any of the marker's patterns.
+        # Lowercase each field once and prepare the text for every search_in
+        # combination up front, instead of rebuilding it for each marker
+        title_lower = apartment.title.lower() if apartment.title else ""
+        description_lower = apartment.description.lower() if apartment.description else ""
+        texts: dict[_SearchKey, str] = {
+            (True, True): " ".join(part for part in (title_lower, description_lower) if part),
+            (True, False): title_lower,
+            (False, True): description_lower,
+            (False, False): "",
+        }
+
+        # Markers hit by a substring in one automaton pass per searched text
+        matched: set[int] = set()
+        if self._automaton is not None:
+            for key in self._substring_keys:
+                for _, indices in self._automaton.iter(texts[key]):
+                    matched.update(i for i in indices if self._compiled[i][1] == key)
+
+        return [
+            marker.name
+            for index, (marker, key, patterns) in enumerate(self._compiled)
+            if index in matched or self._matches_marker(texts[key], patterns)
+        ]
+
+    def _matches_marker(self, text_lower: str, patterns: list[re.Pattern[str]]) -> bool:
+        """Check if text matches any of the marker's patterns.
 
         Args:
-            apartment: The apartment to check
-            marker: Marker configuration
+            text_lower: Lowercased text of the fields the marker searches
+            patterns: The marker's precompiled patterns
 
         Returns:
-            True if any pattern matches in any configured field
+            True if any pattern matches
         """
-        # Collect text from configured fields
-        text_parts = []
-        if "title" in marker.search_in and apartment.title:
-            text_parts.append(apartment.title)
-        if "description" in marker.search_in and apartment.description:
-            text_parts.append(apartment.description)
-
-        # Combine all text (case-insensitive)
-        text_lower = " ".join(text_parts).lower()
-
-        for pattern in marker.patterns:
-            pattern_lower = pattern.lower()
-
-            # Check if pattern looks like regex (contains regex special chars)
-            is_regex = any(char in pattern for char in r"^$.*+?[]{}()\|")
-
-            if is_regex:
-                # Regex matching
-                try:
-                    if re.search(pattern_lower, text_lower, re.IGNORECASE):
-                        return True
-                except re.error:
-                    # Invalid regex, try exact match as fallback
-                    if pattern_lower in text_lower:
-                        return True
-            # Exact substring matching
-            elif pattern_lower in text_lower:
-                return True
-
-        return False
+        return any(pattern.search(text_lower) for pattern in patterns)
 
     def detect_and_update(self, apartment: Flat) -> Flat:
         """Detect markers and update the apartment's markers field.
@@ -102,10 +185,8 @@ class MarkerDetector:
         Returns:
             Human-readable label, or None if marker not found
         """
-        for marker in self.markers:
-            if marker.name == marker_name:
-                return marker.label
-        return None
+        marker = self._by_name.get(marker_name)
+        return marker.label if marker else None
 
     def get_marker_priority(self, marker_name: str) -> str | None:
         """Get the priority level for a marker name.
@@ -116,7 +197,5 @@ class MarkerDetector:
         Returns:
             Priority level ('low', 'medium', 'high'), or None if marker not found
         """
-        for marker in self.markers:
-            if marker.name == marker_name:
-                return marker.priority
-        return None
+        marker = self._by_name.get(marker_name)
+        return marker.priority if marker else None
@@ -18,7 +18,7 @@ class Flat(BaseModel):
     location: str = Field(..., description="Location/address")
     description: str | None = Field(None, description="Full description")
     image_url: HttpUrl | None = Field(None, description="Main image URL")
-    source: str = Field(..., description="Source scraper name")
+    source: str = Field(..., min_length=1, description="Source scraper name")
     markers: list[str] = Field(
         default_factory=list, description="Detected markers (e.g., 'vormerkung_possible')"
     )
@@ -1,13 +1,20 @@
 """Scraper orchestration and management."""
 
+import atexit
+import functools
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 
+import httpx
+
 from wohnung.models import Flat, ScraperResult
 from wohnung.scrapers.arwag import ArwagScraper
 from wohnung.scrapers.athome import AthomeScraper
-from wohnung.scrapers.base import BaseScraper
+from wohnung.scrapers.base import BaseScraper, create_http_client
 from wohnung.scrapers.bwsg import BwsgScraper
 from wohnung.scrapers.ebg import EbgScraper
 from wohnung.scrapers.egw import EgwScraper
@@ -23,7 +30,7 @@ from wohnung.scrapers.sozialbau import SozialbauScraper
 from wohnung.scrapers.wohnberatung_wien import WohnberatungWienScraper
 
 # Register all scrapers here
-SCRAPERS: list[type[BaseScraper]] = [
+SCRAPERS: tuple[type[BaseScraper], ...] = (
     OEVWScraper,
     WohnberatungWienScraper,
     MigraScraper,
@@ -40,17 +47,43 @@ SCRAPERS: list[type[BaseScraper]] = [
     NordwestbahnhofScraper,
     # SozialbauScraper,  # Disabled: scraper not working properly
     # Add more scrapers as you implement them
-]
+)
+
+# Serializes status output from scrapers running in parallel
+_PRINT_LOCK = threading.Lock()
 
+# Flat fields written per flat to the scraper log, read in one call
+_FLAT_LOG_FIELDS = attrgetter("id", "title", "location", "price", "url")
 
-def get_scrapers() -> list[BaseScraper]:
+
+def get_scrapers(client: httpx.Client | None = None) -> list[BaseScraper]:
     """
     Get instances of all registered scrapers.
 
+    Args:
+        client: HTTP client shared by all scrapers. If omitted, each scraper
+            creates its own.
+
     Returns:
         List of scraper instances
     """
-    return [scraper_class() for scraper_class in SCRAPERS]
+    return [scraper_class(client) for scraper_class in SCRAPERS]
+
+
+@functools.cache
+def _default_client() -> httpx.Client:
+    """
+    Get the HTTP client used when run_all_scrapers creates its own scrapers.
+
+    The client is created on first use and kept for the rest of the process,
+    so repeated runs reuse its warm connections. It is closed at exit.
+
+    Returns:
+        Shared httpx client
+    """
+    client = create_http_client()
+    atexit.register(client.close)
+    return client
 
 
 def _write_scraper_log(
@@ -67,114 +100,148 @@ def _write_scraper_log(
     finished_at = datetime.now()
     duration = (finished_at - started_at).total_seconds()
 
-    lines: list[str] = [
-        f"scraper:    {name}",
-        f"started:    {started_at.strftime('%Y-%m-%d %H:%M:%S')}",
-        f"finished:   {finished_at.strftime('%Y-%m-%d %H:%M:%S')} ({duration:.1f}s)",
-        f"status:     {health_status.upper()}",
-        f"results:    {len(flats)} Wohnungen gefunden",
-    ]
+    # The fixed header is formatted in one go; only the variable sections
+    # below are built line by line
+    header = (
+        f"scraper:    {name}\n"
+        f"started:    {started_at:%Y-%m-%d %H:%M:%S}\n"
+        f"finished:   {finished_at:%Y-%m-%d %H:%M:%S} ({duration:.1f}s)\n"
+        f"status:     {health_status.upper()}\n"
+        f"results:    {len(flats)} Wohnungen gefunden"
+    )
+    lines: list[str] = [header]
 
     if warnings:
-        lines.append("")
-        lines.append("warnings:")
-        for w in warnings:
-            lines.append(f"  - {w}")
+        lines.append("\nwarnings:")
+        lines.extend(f"  - {w}" for w in warnings)
 
     if errors:
-        lines.append("")
-        lines.append("errors:")
-        for e in errors:
-            lines.append(f"  - {e}")
+        lines.append("\nerrors:")
+        lines.extend(f"  - {e}" for e in errors)
 
     if flats:
-        lines.append("")
-        lines.append("flats:")
+        lines.append("\nflats:")
         for flat in flats:
-            location = f" | {flat.location}" if flat.location else ""
-            price = f" | {flat.price}" if flat.price else ""
-            lines.append(f"  [{flat.id}] {flat.title}{location}{price}")
-            lines.append(f"    {flat.url}")
+            flat_id, title, location, price, url = _FLAT_LOG_FIELDS(flat)
+            location_part = f" | {location}" if location else ""
+            price_part = f" | {price}" if price else ""
+            lines.append(f"  [{flat_id}] {title}{location_part}{price_part}")
+            lines.append(f"    {url}")
 
+    # Stream the lines into the file instead of joining them into one string first
     log_file = log_dir / f"{name}.log"
-    log_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with log_file.open("w", encoding="utf-8", buffering=1 << 16) as fh:
+        fh.writelines(f"{line}\n" for line in lines)
 
 
-def run_all_scrapers() -> list[ScraperResult]:
+def _run_scraper(scraper: BaseScraper, log_dir: Path) -> ScraperResult:
     """
-    Run all registered scrapers and collect results.
+    Run a single scraper, write its log file and report its status.
+
+    Status lines are collected and printed in one block so that output from
+    scrapers running in parallel does not interleave.
+
+    Args:
+        scraper: Scraper instance to run
+        log_dir: Directory for the per-scraper log file
 
     Returns:
-        List of ScraperResult objects with health status
+        ScraperResult with health status
     """
-    from wohnung.config import settings
+    with _PRINT_LOCK:
+        print(f"🔍 Running scraper: {scraper.name}")
+    started_at = datetime.now()
+    report: list[str] = []
 
-    results: list[ScraperResult] = []
+    try:
+        with scraper:
+            flats = scraper.scrape()
 
-    for scraper in get_scrapers():
-        print(f"🔍 Running scraper: {scraper.name}")
-        started_at = datetime.now()
-
-        try:
-            with scraper:
-                flats = scraper.scrape()
-
-                # Check health of results
-                health_status, warnings = scraper.check_health(flats)
-
-                # Print status with appropriate emoji
-                if health_status == "healthy":
-                    print(f"✅ Found {len(flats)} flats from {scraper.name}")
-                elif health_status == "unhealthy":
-                    print(f"⚠️  Found {len(flats)} flats from {scraper.name} (needs attention)")
-                    for warning in warnings:
-                        print(f"    ⚠️  {warning}")
-                else:
-                    print(f"❌ Scraper {scraper.name} failed")
-
-                _write_scraper_log(
-                    log_dir=settings.log_dir,
-                    name=scraper.name,
-                    started_at=started_at,
-                    flats=flats,
-                    health_status=health_status,
-                    warnings=warnings,
-                    errors=[],
-                )
-
-                results.append(
-                    ScraperResult(
-                        flats=flats,
-                        source=scraper.name,
-                        health_status=health_status,
-                        warnings=warnings,
-                    )
-                )
-        except Exception as e:
-            error_msg = f"Error running {scraper.name}: {e!s}"
-            tb = traceback.format_exc()
-            print(f"❌ {error_msg}")
+            # Check health of results
+            health_status, warnings = scraper.check_health(flats)
+
+            # Report status with appropriate emoji
+            if health_status == "healthy":
+                report.append(f"✅ Found {len(flats)} flats from {scraper.name}")
+            elif health_status == "unhealthy":
+                report.append(f"⚠️  Found {len(flats)} flats from {scraper.name} (needs attention)")
+                report.extend(f"    ⚠️  {warning}" for warning in warnings)
+            else:
+                report.append(f"❌ Scraper {scraper.name} failed")
 
             _write_scraper_log(
-                log_dir=settings.log_dir,
+                log_dir=log_dir,
                 name=scraper.name,
                 started_at=started_at,
-                flats=[],
-                health_status="failed",
-                warnings=[],
-                errors=[error_msg, tb],
+                flats=flats,
+                health_status=health_status,
+                warnings=warnings,
+                errors=[],
             )
 
-            results.append(
-                ScraperResult(
-                    flats=[],
-                    source=scraper.name,
-                    errors=[error_msg],
-                    health_status="failed",
-                )
+            result = ScraperResult(
+                flats=flats,
+                source=scraper.name,
+                health_status=health_status,
+                warnings=warnings,
             )
+    except Exception as e:
+        error_msg = f"Error running {scraper.name}: {e!s}"
+        tb = traceback.format_exc()
+        report.append(f"❌ {error_msg}")
+
+        _write_scraper_log(
+            log_dir=log_dir,
+            name=scraper.name,
+            started_at=started_at,
+            flats=[],
+            health_status="failed",
+            warnings=[],
+            errors=[error_msg, tb],
+        )
+
+        result = ScraperResult(
+            flats=[],
+            source=scraper.name,
+            errors=[error_msg],
+            health_status="failed",
+        )
+
+    with _PRINT_LOCK:
+        print("\n".join(report))
+    return result
+
+
+def run_all_scrapers(scrapers: list[BaseScraper] | None = None) -> list[ScraperResult]:
+    """
+    Run scrapers in parallel and collect results.
 
-    return results
+    Scrapers spend nearly all their time waiting on the network, so each
+    one runs in its own thread and the total time is roughly that of the
+    slowest site instead of the sum of all of them.
+
+    Args:
+        scrapers: Scraper instances to run, e.g. from get_scrapers(client) when
+            the caller needs the instances afterwards. If omitted, all registered
+            scrapers are created around a shared HTTP client that is kept open
+            for later runs.
+
+    Returns:
+        List of ScraperResult objects with health status, in scraper order
+    """
+    from wohnung.config import settings
+
+    if scrapers is None:
+        # One pooled client for all scrapers and all runs, so connections and
+        # TLS sessions are reused
+        scrapers = get_scrapers(_default_client())
+
+    if not scrapers:
+        return []
+
+    log_dir = settings.log_dir
+    with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+        return list(executor.map(lambda scraper: _run_scraper(scraper, log_dir), scrapers))
 
 
 def deduplicate_flats(flats: list[Flat]) -> list[Flat]:
@@ -187,15 +254,12 @@ def deduplicate_flats(flats: list[Flat]) -> list[Flat]:
     Returns:
         List of unique flats
     """
-    seen_ids: set[str] = set()
-    unique_flats: list[Flat] = []
-
+    # Dicts keep insertion order, so this keeps the first flat seen for each ID
+    unique_flats: dict[str, Flat] = {}
     for flat in flats:
-        if flat.id not in seen_ids:
-            seen_ids.add(flat.id)
-            unique_flats.append(flat)
+        unique_flats.setdefault(flat.id, flat)
 
-    return unique_flats
+    return list(unique_flats.values())
 
 
 __all__ = ["SCRAPERS", "deduplicate_flats", "get_scrapers", "run_all_scrapers"]
@@ -6,12 +6,18 @@ Scrapes projects from https://www.arwag.at/projekte/
 import re
 from datetime import datetime
 
-import requests  # type: ignore[import-untyped]
 from bs4 import BeautifulSoup
+from bs4.filter import SoupStrainer
 
 from wohnung.models import Flat
 from wohnung.scrapers.base import BaseScraper
 
+_SRCSET_ASSET_RE = re.compile(r"(/assets/[^\s]+)")
+
+# The only tags _parse_project reads (with their children); wrappers, scripts
+# and icons in a project's HTML are skipped while parsing
+_PROJECT_TAGS = SoupStrainer(["h2", "a", "p", "img"])
+
 
 class ArwagScraper(BaseScraper):
     """Scraper for ARWAG housing projects."""
@@ -32,22 +38,17 @@ class ArwagScraper(BaseScraper):
         Returns:
             List of Flat objects
         """
-        flats = []
+        flats: list[Flat] = []
 
         try:
             # Fetch residential projects via lazy list API
             api_url = "https://www.arwag.at/projekte/lazylist/load/ResidentialProjectGroups"
-            response = requests.get(api_url, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
+            data = self.fetch_json(api_url)
             projects = data.get("list", [])
 
-            # Parse each project
-            for project in projects:
-                flat = self._parse_project(project)
-                if flat:
-                    flats.append(flat)
+            # Parse each project, dropping those that could not be parsed
+            parsed = (self._parse_project(project) for project in projects)
+            flats = [flat for flat in parsed if flat is not None]
 
         except Exception as e:
             print(f"Error scraping ARWAG: {e}")
@@ -71,7 +72,7 @@ class ArwagScraper(BaseScraper):
                 return None
 
             # Parse HTML
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, "lxml", parse_only=_PROJECT_TAGS)
 
             # Extract title
             title_elem = soup.find("h2", class_="app-ObjectGridEntry-headline")
@@ -117,7 +118,7 @@ class ArwagScraper(BaseScraper):
                 srcset = img.get("data-srcset", "")  # type: ignore[union-attr]
                 if srcset:
                     # Extract first URL from srcset
-                    match = re.search(r"(/assets/[^\s]+)", str(srcset))  # type: ignore[arg-type]
+                    match = _SRCSET_ASSET_RE.search(str(srcset))  # type: ignore[arg-type]
                     if match:
                         image_url = f"https://www.arwag.at{match.group(1)}"
                 else:
@@ -3,12 +3,16 @@
 import re
 from typing import Any
 
-import requests  # type: ignore[import-untyped]
 from bs4 import BeautifulSoup
+from bs4.filter import SoupStrainer
 
 from wohnung.models import Flat
 from wohnung.scrapers.base import BaseScraper
 
+# Matches the class within a multi-valued class attribute, which the strainer
+# sees unsplit while parsing
+_PROJECT_ITEMS = SoupStrainer("a", class_=re.compile(r"(?:^|\s)project-grid-item(?:\s|$)"))
+
 
 class AthomeScraper(BaseScraper):
     """Scraper for at home Immobilien projects."""
@@ -31,21 +35,20 @@ class AthomeScraper(BaseScraper):
         """Scrape all projects from at home."""
         url = f"{self.base_url}/projekte/"
 
-        response = requests.get(url, timeout=30)
+        response = self.client.get(url)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        # Only the project grid items are turned into a tree; the rest of the
+        # page is skipped while parsing
+        soup = BeautifulSoup(
+            response.content, "lxml", from_encoding=response.encoding, parse_only=_PROJECT_ITEMS
+        )
 
-        flats = []
         # Find all project grid items
         project_items = soup.find_all("a", class_="project-grid-item")
 
-        for item in project_items:
-            flat = self._parse_project(item)
-            if flat:
-                flats.append(flat)
-
-        return flats
+        parsed = (self._parse_project(item) for item in project_items)
+        return [flat for flat in parsed if flat is not None]
 
     def _parse_project(self, item: Any) -> Flat | None:
         """Parse a single project item into a Flat object."""
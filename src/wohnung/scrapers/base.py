@@ -1,32 +1,96 @@
 """Base scraper class and protocols."""
 
+import functools
 import hashlib
 import logging
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from typing import Any
 
 import httpx
+import orjson
 from bs4 import BeautifulSoup
 
 from wohnung.config import settings
 from wohnung.models import Flat
 
+# HTTP/2 needs the h2 package; optional: pip install "wohnung-scraper[http2]"
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Upper bound on concurrent page fetches per scraper; keeps the scrapers that
+# run in parallel within the shared client's connection pool
+MAX_PARALLEL_FETCHES = 8
+
+# Patterns used by the parse_* helpers, compiled once at import
+_CURRENCY_RE = re.compile(r"[€$£\s]")
+_EURO_DECIMALS_RE = re.compile(r",\d{2}$")
+_NUMBER_RE = re.compile(r"\d+\.?\d*")
+_SIZE_RE = re.compile(r"(\d+\.?\d*)\s*(?:m²|m2|sqm)", re.IGNORECASE)
+_ROOMS_RE = re.compile(r"(\d+\.?\d*)")
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_price(price_str: str) -> float | None:
+    """Parse a price string; cached, as listings repeat the same price texts."""
+    # Remove common currency symbols and whitespace
+    cleaned = _CURRENCY_RE.sub("", price_str)
+
+    # Check if it looks like European format (1.200,50) or US format (1,200.50)
+    # If there's a comma after the last period, or last comma is followed by 2 digits, it's likely decimal
+    if _EURO_DECIMALS_RE.search(cleaned):  # European: 1.200,50
+        cleaned = cleaned.replace(".", "").replace(",", ".")
+    else:  # US format: 1,200.50 or simple: 1200
+        cleaned = cleaned.replace(",", "")
+
+    match = _NUMBER_RE.search(cleaned)
+    if match:
+        try:
+            return float(match.group())
+        except ValueError:
+            return None
+    return None
+
+
+def create_http_client() -> httpx.Client:
+    """
+    Create an HTTP client with the configured timeout and user agent.
+
+    The connection pool is sized so that one client can be shared by all
+    scrapers running in parallel, each fetching several pages at once, while
+    keeping connections alive. HTTP/2 is used when h2 is installed, so
+    requests to the same site can share one connection.
+
+    Returns:
+        Configured httpx client
+    """
+    return httpx.Client(
+        http2=_HTTP2_AVAILABLE,
+        timeout=settings.request_timeout,
+        headers={"User-Agent": settings.user_agent},
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=64, max_keepalive_connections=32, keepalive_expiry=30.0
+        ),
+    )
+
 
 class BaseScraper(ABC):
     """Abstract base class for all scrapers."""
 
-    def __init__(self) -> None:
-        """Initialize the scraper."""
-        self.client = httpx.Client(
-            timeout=settings.request_timeout,
-            headers={"User-Agent": settings.user_agent},
-            follow_redirects=True,
-        )
-        self.logger = self._get_logger()
+    def __init__(self, client: httpx.Client | None = None) -> None:
+        """
+        Initialize the scraper.
 
-    def _get_logger(self) -> logging.Logger:
-        """Get logger for this scraper."""
-        return logging.getLogger(f"wohnung.scrapers.{self.name}")
+        Args:
+            client: Shared HTTP client to use. If omitted, the scraper creates
+                its own client and closes it when done.
+        """
+        self._owns_client = client is None
+        self.client = create_http_client() if client is None else client
+        self.logger = logging.getLogger(f"wohnung.scrapers.{self.name}")
 
     @property
     def minimum_expected_results(self) -> int:
@@ -103,6 +167,10 @@ class BaseScraper(ABC):
         """
         Generate a unique ID for a flat based on source and URL.
 
+        IDs are persisted in site storage and drive change detection, so the
+        hash must not change: a different digest would report every stored
+        flat as removed and re-added.
+
         Args:
             url: The flat's URL
 
@@ -122,23 +190,7 @@ class BaseScraper(ABC):
         Returns:
             Price as float or None if parsing fails
         """
-        # Remove common currency symbols and whitespace
-        cleaned = re.sub(r"[€$£\s]", "", price_str)
-
-        # Check if it looks like European format (1.200,50) or US format (1,200.50)
-        # If there's a comma after the last period, or last comma is followed by 2 digits, it's likely decimal
-        if re.search(r",\d{2}$", cleaned):  # European: 1.200,50
-            cleaned = cleaned.replace(".", "").replace(",", ".")
-        else:  # US format: 1,200.50 or simple: 1200
-            cleaned = cleaned.replace(",", "")
-
-        match = re.search(r"\d+\.?\d*", cleaned)
-        if match:
-            try:
-                return float(match.group())
-            except ValueError:
-                return None
-        return None
+        return _parse_price(price_str)
 
     def parse_size(self, size_str: str) -> float | None:
         """
@@ -152,7 +204,7 @@ class BaseScraper(ABC):
         """
         # Extract number before m², m2, or sqm
         cleaned = size_str.replace(",", ".")
-        match = re.search(r"(\d+\.?\d*)\s*(?:m²|m2|sqm)", cleaned, re.IGNORECASE)
+        match = _SIZE_RE.search(cleaned)
         if match:
             try:
                 return float(match.group(1))
@@ -171,7 +223,7 @@ class BaseScraper(ABC):
             Number of rooms or None if parsing fails
         """
         cleaned = rooms_str.replace(",", ".")
-        match = re.search(r"(\d+\.?\d*)", cleaned)
+        match = _ROOMS_RE.search(cleaned)
         if match:
             try:
                 return float(match.group(1))
@@ -194,7 +246,54 @@ class BaseScraper(ABC):
         """
         response = self.client.get(url)
         response.raise_for_status()
-        return BeautifulSoup(response.text, "lxml")
+        return BeautifulSoup(response.content, "lxml", from_encoding=response.encoding)
+
+    def fetch_json(self, url: str) -> Any:
+        """
+        Fetch and decode JSON from a URL.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            Decoded JSON data
+
+        Raises:
+            httpx.HTTPError: If request fails
+            orjson.JSONDecodeError: If the response is not valid JSON
+        """
+        response = self.client.get(url)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def fetch_html_many(self, urls: Sequence[str]) -> list[BeautifulSoup | None]:
+        """
+        Fetch and parse several pages concurrently.
+
+        The requests share the scraper's client from a small thread pool, so
+        their round trips overlap instead of adding up.
+
+        Args:
+            urls: URLs to fetch
+
+        Returns:
+            Parsed pages in the order of ``urls``; None for pages that failed to load or parse
+        """
+
+        def fetch(url: str) -> BeautifulSoup | None:
+            # One bad page must not abort the others: any error (HTTP, decode,
+            # parse) turns into None for that page
+            try:
+                return self.fetch_html(url)
+            except Exception as e:
+                self.logger.debug(f"Failed to fetch {url}: {e}")
+                return None
+
+        if not urls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(len(urls), MAX_PARALLEL_FETCHES)) as executor:
+            return list(executor.map(fetch, urls))
 
     def __enter__(self) -> "BaseScraper":
         """Context manager entry."""
@@ -202,8 +301,9 @@ class BaseScraper(ABC):
 
     def __exit__(self, *args: object) -> None:
         """Context manager exit - cleanup resources."""
-        self.client.close()
+        self.close()
 
     def close(self) -> None:
-        """Close HTTP client and cleanup resources."""
-        self.client.close()
+        """Close HTTP client and cleanup resources (a shared client is left open)."""
+        if self._owns_client:
+            self.client.close()
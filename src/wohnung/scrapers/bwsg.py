@@ -3,12 +3,24 @@
 import re
 from typing import Any
 
-import requests  # type: ignore[import-untyped]
+import soupsieve as sv
 from bs4 import BeautifulSoup
+from bs4.filter import SoupStrainer
 
 from wohnung.models import Flat
 from wohnung.scrapers.base import BaseScraper
 
+# Property containers, the only part of the search page that is read
+_PROPERTY_DIVS = SoupStrainer("div", attrs={"data-objektnummer": True})
+
+# Selectors for the fields of a property container, compiled once
+_ITEM_CLASS = "res_immobiliensuche__immobilien__item"
+_LINK_SELECTOR = sv.compile(f"a.{_ITEM_CLASS}")
+_TITLE_SELECTOR = sv.compile(f"h2.{_ITEM_CLASS}__content__title")
+_LOCATION_SELECTOR = sv.compile(f"span.{_ITEM_CLASS}__content__meta__location")
+_PRICE_SELECTOR = sv.compile(f"span.{_ITEM_CLASS}__content__meta__preis")
+_IMAGE_SELECTOR = sv.compile("img")
+
 
 class BwsgScraper(BaseScraper):
     """Scraper for BWSG subsidized housing."""
@@ -32,10 +44,12 @@ class BwsgScraper(BaseScraper):
         # URL filtered for subsidized apartments and houses
         url = f"{self.base_url}/immobilien/immobilie-suchen/?_objektart=haus%2Cwohnung&_finanzierung=gefoerdert"
 
-        response = requests.get(url, timeout=30)
+        response = self.client.get(url)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(
+            response.content, "lxml", from_encoding=response.encoding, parse_only=_PROPERTY_DIVS
+        )
 
         flats = []
         # Find all property containers
@@ -56,24 +70,21 @@ class BwsgScraper(BaseScraper):
             return None
 
         # Find the link
-        link_tag = prop_div.find("a", class_="res_immobiliensuche__immobilien__item")
+        link_tag = _LINK_SELECTOR.select_one(prop_div)
         if not link_tag:
             return None
 
-        property_url = link_tag.get("href", "")
+        href = link_tag.get("href", "")
+        property_url = href if isinstance(href, str) else ""
         if not property_url:
             return None
 
         # Get title
-        title_tag = prop_div.find(
-            "h2", class_="res_immobiliensuche__immobilien__item__content__title"
-        )
+        title_tag = _TITLE_SELECTOR.select_one(prop_div)
         title = title_tag.get_text(strip=True) if title_tag else ""
 
         # Get location
-        location_tag = prop_div.find(
-            "span", class_="res_immobiliensuche__immobilien__item__content__meta__location"
-        )
+        location_tag = _LOCATION_SELECTOR.select_one(prop_div)
         location = ""
         if location_tag:
             # Extract postal code and city
@@ -85,19 +96,18 @@ class BwsgScraper(BaseScraper):
             location = re.sub(r"(\d{4})([A-Z])", r"\1 \2", location_text)
 
         # Get price
-        price_tag = prop_div.find(
-            "span", class_="res_immobiliensuche__immobilien__item__content__meta__preis"
-        )
+        price_tag = _PRICE_SELECTOR.select_one(prop_div)
         price = None
         if price_tag:
             price_text = price_tag.get_text(strip=True)
             price = self.parse_price(price_text)
 
         # Get image URL
-        image_tag = prop_div.find("img")
+        image_tag = _IMAGE_SELECTOR.select_one(prop_div)
         image_url = None
         if image_tag:
-            image_url = image_tag.get("src", "")
+            src = image_tag.get("src", "")
+            image_url = src if isinstance(src, str) else None
 
         # Determine markers
         markers = []
@@ -114,13 +124,13 @@ class BwsgScraper(BaseScraper):
         flat = Flat(
             id=property_id.replace("/", "-"),
             title=title,
-            url=property_url,
+            url=property_url,  # type: ignore[arg-type]
             price=price,
             location=location,
             size=None,
             rooms=None,
             description=None,
-            image_url=image_url if image_url else None,
+            image_url=image_url if image_url else None,  # type: ignore[arg-type]
             source=self.name,
             markers=markers,
         )
@@ -2,9 +2,34 @@
 
 import re
 
+from bs4 import BeautifulSoup, Tag
+
 from wohnung.models import Flat
 from wohnung.scrapers.base import BaseScraper
 
+_PROJECT_LINK_RE = re.compile(r"/in-planung/projekte/detail/\d+")
+_DESCRIPTION_HEADING_RE = re.compile(r"BESCHREIBUNG")
+# Austrian postal code followed by a few words of address
+_POSTAL_LOCATION_RE = re.compile(r"(\d{4}\s+[\w\s-]+(?:\s+[\w\s\.-]+){1,3})")
+# Window of the page text searched for a location, skipping the navigation
+_LOCATION_TEXT_START = 200
+_LOCATION_TEXT_END = 1000
+_WHITESPACE_RE = re.compile(r"\s+")
+# e.g. "136 Wohnungen"
+_UNITS_RE = re.compile(r"(\d+)\s+(?:Wohnungen|Wohneinheiten)")
+# e.g. "Geplanter Bezug: 3. Quartal 2028"
+_MOVE_IN_RE = re.compile(r"(?:Geplanter Bezug|Bezug|Fertigstellung):\s*([^.]+)")
+# Section headings on detail pages that are not project titles
+_SECTION_HEADINGS = frozenset({"BESCHREIBUNG", "LAGEPLAN", "VORMERKUNG", "ARCHITEKTUR"})
+
+
+def _is_project_title(text: str | None) -> bool:
+    """Check whether a heading's text is a project title rather than a section heading."""
+    if not text:
+        return False
+    text = text.strip()
+    return len(text) > 3 and text.upper() not in _SECTION_HEADINGS  # noqa: PLR2004
+
 
 class EbgScraper(BaseScraper):
     """Scraper for EBG Wohnen projects in planning."""
@@ -21,44 +46,43 @@ class EbgScraper(BaseScraper):
 
     def scrape(self) -> list[Flat]:
         """Scrape projects from EBG in-planning page."""
-        url = f"{self.base_url}/in-planung/projekte"
+        base_url = self.base_url
+        url = f"{base_url}/in-planung/projekte"
         soup = self.fetch_html(url)
         flats = []
-        seen_urls = set()
 
         # Find all project links - they point to /in-planung/projekte/detail/{id}
-        project_links = soup.find_all("a", href=re.compile(r"/in-planung/projekte/detail/\d+"))
+        project_links = soup.find_all("a", href=_PROJECT_LINK_RE)
 
         self.logger.info(f"Found {len(project_links)} project links")
 
+        # Keep the first link per href, in page order
+        links_by_href: dict[str, Tag] = {}
         for link in project_links:
-            href = link.get("href", "")
-            if not href or href in seen_urls:
+            links_by_href.setdefault(link.get("href", ""), link)
+        links_by_href.pop("", None)
+
+        # Collect the projects first so their detail pages can be fetched together
+        projects: list[tuple[str, str]] = []
+        for href, link in links_by_href.items():
+            full_url = f"{base_url}{href}" if href.startswith("/") else href
+
+            title = self._link_title(link)
+            if not title:
+                self.logger.debug(f"Skipping link without proper title: {href}")
                 continue
 
-            seen_urls.add(href)
-            full_url = f"{self.base_url}{href}" if href.startswith("/") else href
+            projects.append((full_url, title))
 
-            try:
-                # Get project title from link text
-                title = link.get_text(strip=True)
-
-                # Skip if title is just "MIETE" or empty
-                if not title or title.upper() == "MIETE":
-                    # Try to find title in parent element
-                    parent = link.parent
-                    if parent:
-                        # Look for heading or title in parent
-                        title_elem = parent.find(["h2", "h3", "h4", "h5", "h6"])
-                        if title_elem:
-                            title = title_elem.get_text(strip=True)
-
-                if not title or title.upper() == "MIETE":
-                    self.logger.debug(f"Skipping link without proper title: {href}")
-                    continue
+        # Fetch project detail pages for full information
+        pages = self.fetch_html_many([full_url for full_url, _ in projects])
+
+        for (full_url, title), page in zip(projects, pages, strict=True):
+            if page is None:
+                continue
 
-                # Fetch project detail page for full information
-                flat = self._scrape_project(full_url, title)
+            try:
+                flat = self._parse_project(full_url, page, title)
                 if flat:
                     flats.append(flat)
             except Exception as e:
@@ -67,24 +91,34 @@ class EbgScraper(BaseScraper):
 
         return flats
 
-    def _scrape_project(self, url: str, fallback_title: str | None = None) -> Flat | None:  # noqa: C901, PLR0912, PLR0915
-        """Scrape a single project detail page."""
-        try:
-            soup = self.fetch_html(url)
-        except Exception as e:
-            self.logger.debug(f"Failed to fetch {url}: {e}")
+    def _link_title(self, link: Tag) -> str | None:
+        """Get a project's title from its link, or None if it has no proper title."""
+        # Get project title from link text
+        title = link.get_text(strip=True)
+
+        # Skip if title is just "MIETE" or empty
+        if not title or title.upper() == "MIETE":
+            # Try to find title in parent element
+            parent = link.parent
+            if parent:
+                # Look for heading or title in parent
+                title_elem = parent.find(["h2", "h3", "h4", "h5", "h6"])
+                if title_elem:
+                    title = title_elem.get_text(strip=True)
+
+        if not title or title.upper() == "MIETE":
             return None
+        return title
 
+    def _parse_project(  # noqa: C901, PLR0912, PLR0915
+        self, url: str, soup: BeautifulSoup, fallback_title: str | None = None
+    ) -> Flat | None:
+        """Parse a single project detail page."""
         location: str = ""  # Initialize location
         title: str = ""  # Initialize title
 
         # Extract project title - usually in an h3
-        title_tag = soup.find(
-            ["h3", "h2", "h1"],
-            string=lambda x: x
-            and len(x.strip()) > 3  # noqa: PLR2004
-            and x.strip().upper() not in ["BESCHREIBUNG", "LAGEPLAN", "VORMERKUNG", "ARCHITEKTUR"],
-        )
+        title_tag = soup.find(["h3", "h2", "h1"], string=_is_project_title)
         if title_tag:
             title = title_tag.get_text(strip=True)
 
@@ -115,16 +149,26 @@ class EbgScraper(BaseScraper):
         if not location:
             # Look for location in main content area (skip navigation)
             main_content = soup.find(["main", "article"]) or soup
-            content_text = main_content.get_text()
+
+            # Only the first 1000 characters are searched, so stop collecting
+            # text once they are available
+            parts = []
+            length = 0
+            for string in main_content.strings:
+                parts.append(string)
+                length += len(string)
+                if length >= _LOCATION_TEXT_END:
+                    break
+            content_text = "".join(parts)
 
             # Look for Austrian postal code patterns
-            location_match = re.search(
-                r"(\d{4}\s+[\w\s-]+(?:\s+[\w\s\.-]+){1,3})", content_text[200:1000]
+            location_match = _POSTAL_LOCATION_RE.search(
+                content_text, _LOCATION_TEXT_START, _LOCATION_TEXT_END
             )
             if location_match:
                 location = location_match.group(1).strip()
                 # Clean up potential garbage
-                location = re.sub(r"\s+", " ", location)
+                location = _WHITESPACE_RE.sub(" ", location)
                 # Limit length
                 if len(location) > 100:  # noqa: PLR2004
                     location = location[:100]
@@ -135,13 +179,16 @@ class EbgScraper(BaseScraper):
 
         # Extract description from the BESCHREIBUNG section
         description_parts = []
-        description_section = soup.find(string=re.compile(r"BESCHREIBUNG"))
+        description_section = soup.find(string=_DESCRIPTION_HEADING_RE)
         if description_section:
             # Get the parent and find following paragraphs
             parent = description_section.find_parent()
             if parent:
-                # Find all paragraphs in the parent's next siblings
-                for sibling in parent.find_next_siblings(["p", "div"]):
+                # Walk the parent's next siblings lazily, stopping once enough
+                # paragraphs are collected
+                for sibling in parent.next_siblings:
+                    if not isinstance(sibling, Tag) or sibling.name not in ("p", "div"):
+                        continue
                     text = sibling.get_text(strip=True)
                     if text and len(text) > 20:  # noqa: PLR2004
                         description_parts.append(text)
@@ -149,9 +196,11 @@ class EbgScraper(BaseScraper):
                             break
 
         if not description_parts:
-            # Fallback: get first few substantial paragraphs
-            paragraphs = soup.find_all("p")
-            for p in paragraphs:
+            # Fallback: get first few substantial paragraphs, walking the tree
+            # only as far as needed
+            for p in soup.descendants:
+                if not isinstance(p, Tag) or p.name != "p":
+                    continue
                 text = p.get_text(strip=True)
                 if text and len(text) > 50:  # noqa: PLR2004
                     description_parts.append(text)
@@ -162,14 +211,12 @@ class EbgScraper(BaseScraper):
 
         # Extract number of units if mentioned
         # Look for patterns like "136 Wohnungen" or "100 Wohnungen"
-        units_match = re.search(r"(\d+)\s+(?:Wohnungen|Wohneinheiten)", description)
+        units_match = _UNITS_RE.search(description)
         units_count = int(units_match.group(1)) if units_match else None
 
         # Extract move-in date if mentioned
         # Look for "Geplanter Bezug: 3. Quartal 2028"
-        move_in_match = re.search(
-            r"(?:Geplanter Bezug|Bezug|Fertigstellung):\s*([^.]+)", description
-        )
+        move_in_match = _MOVE_IN_RE.search(description)
         move_in_date = move_in_match.group(1).strip() if move_in_match else None
 
         # Generate ID
@@ -1,14 +1,15 @@
 """Scraper for EGW (Erste gemeinnützige Wohnungsgesellschaft)."""
 
-import json
-import re
 from typing import Any
 
-import requests  # type: ignore[import-untyped]
+import orjson
 
 from wohnung.models import Flat
 from wohnung.scrapers.base import BaseScraper
 
+_PROJECTS_START = b"var projects = ["
+_PROJECTS_END = b"];</script>"
+
 
 class EgwScraper(BaseScraper):
     """Scraper for EGW projects."""
@@ -30,16 +31,21 @@ class EgwScraper(BaseScraper):
     def scrape(self) -> list[Flat]:
         """Scrape all projects from EGW."""
         url = "https://www.egw.at/projekte"
-        response = requests.get(url, timeout=30)
+        response = self.client.get(url)
         response.raise_for_status()
 
-        # Extract projects JSON from embedded JavaScript
-        match = re.search(r"var projects = (\[.*?\]);</script>", response.text, re.DOTALL)
-        if not match:
+        # Extract projects JSON from embedded JavaScript, straight from the
+        # response bytes: "var projects = [...];</script>"
+        content = response.content
+        start = content.find(_PROJECTS_START)
+        end = content.find(_PROJECTS_END, start) if start != -1 else -1
+        if end == -1:
             raise ValueError("Could not find projects data in page")
 
-        projects_json = match.group(1)
-        projects: list[dict[str, Any]] = json.loads(projects_json)
+        # Keep the opening "[" and the closing "]"
+        projects: list[dict[str, Any]] = orjson.loads(
+            content[start + len(_PROJECTS_START) - 1 : end + 1]
+        )
 
         flats = []
         for project in projects:
@@ -34,6 +34,8 @@ class ExampleScraper(BaseScraper):
             This is a template. Replace with actual scraping logic.
         """
         flats: list[Flat] = []
+        # All flats of one scrape share the same timestamp
+        found_at = datetime.now()
 
         try:
             soup = self.fetch_html(self.base_url)
@@ -84,7 +86,7 @@ class ExampleScraper(BaseScraper):
                     description=None,
                     image_url=image_url,  # type: ignore[arg-type]
                     source=self.name,
-                    found_at=datetime.now(),
+                    found_at=found_at,
                 )
 
                 flats.append(flat)
@@ -1,13 +1,29 @@
 """Scraper for Familienwohnbau."""
 
 import re
+from contextlib import suppress
 
-import requests  # type: ignore[import-untyped]
 from bs4 import BeautifulSoup
+from bs4.filter import SoupStrainer
 
 from wohnung.models import Flat
 from wohnung.scrapers.base import BaseScraper
 
+# Links to object pages, the only part of the projects page that is read
+_OBJECT_LINKS = SoupStrainer("a", href=re.compile("/de/objekt/"))
+
+_PRICE_RE = re.compile(r"Ab\s*€\s*([\d.,]+)")
+_UNITS_RE = re.compile(r"Anzahl der Einheiten:\s*(\d+)")
+# "1210 Wien, Street Name 123", up to a trailing KEYWORD or "("
+_FULL_LOCATION_RE = re.compile(r"^(\d{4}\s+[^,]+,\s*[^A-Z][^(]*?)(?:\s+[A-Z]{3,}|\s*\(|$)")
+# Just postal code + city
+_POSTAL_CITY_RE = re.compile(r"^(\d{4}\s+[^,]+)")
+_OBJECT_SLUG_RE = re.compile(r"/de/objekt/([^?]+)")
+
+# Listings that are just parking/garages ("abstellplatz" contains "stellplatz")
+_SKIP_WORDS = ("garage", "stellplatz")
+_SALE_WORDS = ("eigentum", "verkauf", "kauf")
+
 
 class FamilienwohnbauScraper(BaseScraper):
     """Scraper for Familienwohnbau projects."""
@@ -22,7 +38,7 @@ class FamilienwohnbauScraper(BaseScraper):
         """Return the base URL for this scraper."""
         return "https://familienwohnbau.at"
 
-    def scrape(self) -> list[Flat]:  # noqa: C901, PLR0912
+    def scrape(self) -> list[Flat]:
         """Scrape flats from Familienwohnbau projects page.
 
         Scrapes the main projects page which shows various property offerings
@@ -31,48 +47,60 @@ class FamilienwohnbauScraper(BaseScraper):
         flats = []
 
         # Main projects page
-        url = f"{self.base_url}/de/projekte"
+        base_url = self.base_url
+        url = f"{base_url}/de/projekte"
 
         try:
-            response = requests.get(url, timeout=30)
+            response = self.client.get(url)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(
+                response.content, "lxml", from_encoding=response.encoding, parse_only=_OBJECT_LINKS
+            )
 
             # Find all links to /de/objekt/
             project_links = soup.find_all("a", href=lambda x: x and "/de/objekt/" in x)
 
             for link in project_links:
+                # Find image for metadata
+                img = link.find("img")
+                img_alt = img.get("alt", "") if img else ""
+
+                # Extract location and title from alt text or text
+                # Format is usually: "Location KEYWORD" or just "Location"
+                text: str | None = None
+                if img_alt:
+                    title = img_alt
+                else:
+                    text = link.get_text(strip=True, separator=" ")
+                    title = text.partition("Ab €")[0].strip()
+                title_lower = title.lower()
+
+                # Skip if it's just parking/garages, before any further parsing
+                if any(word in title_lower for word in _SKIP_WORDS):
+                    continue
+
                 href = link.get("href", "")
 
                 # Build full URL
-                full_url = f"{self.base_url}{href}" if href.startswith("/") else href
+                full_url = f"{base_url}{href}" if href.startswith("/") else href
 
-                # Find image for metadata
-                img = link.find("img")
-                img_alt = img.get("alt", "") if img else ""
                 img_src = img.get("src", "") if img else None
 
                 # Get text content
-                text = link.get_text(strip=True, separator=" ")
-
-                # Extract location and title from alt text or text
-                # Format is usually: "Location KEYWORD" or just "Location"
-                title = img_alt if img_alt else text.split("Ab €")[0].strip()
+                if text is None:
+                    text = link.get_text(strip=True, separator=" ")
 
                 # Extract price if available
-                price_match = re.search(r"Ab\s*€\s*([\d.,]+)", text)
+                price_match = _PRICE_RE.search(text)
                 price = None
                 if price_match:
                     price_str = price_match.group(1).replace(".", "").replace(",", ".")
-                    # Use contextlib.suppress instead of try-except-pass
-                    from contextlib import suppress
-
                     with suppress(ValueError):
                         price = float(price_str)
 
                 # Extract number of units
-                units_match = re.search(r"Anzahl der Einheiten:\s*(\d+)", text)
+                units_match = _UNITS_RE.search(text)
                 units_count = units_match.group(1) if units_match else None
 
                 # Parse location from title
@@ -80,40 +108,9 @@ class FamilienwohnbauScraper(BaseScraper):
                 location = None
                 # Try to extract full location including street
                 # Pattern: "1210 Wien, Street Name 123"
-                location_match = re.match(
-                    r"^(\d{4}\s+[^,]+,\s*[^A-Z][^(]*?)(?:\s+[A-Z]{3,}|\s*\(|$)", title
-                )
+                location_match = _FULL_LOCATION_RE.match(title) or _POSTAL_CITY_RE.match(title)
                 if location_match:
                     location = location_match.group(1).strip()
-                elif re.match(r"^\d{4}\s+", title):
-                    # Just has postal code + city
-                    location_match = re.match(r"^(\d{4}\s+[^,]+)", title)
-                    if location_match:
-                        location = location_match.group(1).strip()
-
-                # Determine markers based on title/text
-                markers = []
-                title_lower = title.lower()
-
-                if "miete" in title_lower or "rental" in title_lower:
-                    markers.append("rental")
-                elif any(word in title_lower for word in ["eigentum", "verkauf", "kauf"]):
-                    markers.append("for_sale")
-
-                if "genossenschaft" in title_lower or "gewerbe" in title_lower:
-                    # Gemeinnützige or commercial
-                    markers.append("subsidized")
-
-                if "neubau" in title_lower or "neu" in title_lower:
-                    markers.append("neubau")
-
-                # Skip if it's just parking/garages
-                if (
-                    "garage" in title_lower
-                    or "stellplatz" in title_lower
-                    or "abstellplatz" in title_lower
-                ):
-                    continue
 
                 # Create flat object
                 flat = self._create_flat(
@@ -122,7 +119,7 @@ class FamilienwohnbauScraper(BaseScraper):
                     location=location,
                     price=price,
                     image_url=img_src,
-                    markers=markers,
+                    markers=self._markers_for(title_lower),
                     units_count=units_count,
                 )
 
@@ -134,6 +131,24 @@ class FamilienwohnbauScraper(BaseScraper):
 
         return flats
 
+    def _markers_for(self, title_lower: str) -> list[str]:
+        """Determine markers based on the lowercased title."""
+        markers = []
+
+        if "miete" in title_lower or "rental" in title_lower:
+            markers.append("rental")
+        elif any(word in title_lower for word in _SALE_WORDS):
+            markers.append("for_sale")
+
+        if "genossenschaft" in title_lower or "gewerbe" in title_lower:
+            # Gemeinnützige or commercial
+            markers.append("subsidized")
+
+        if "neubau" in title_lower or "neu" in title_lower:
+            markers.append("neubau")
+
+        return markers
+
     def _create_flat(
         self,
         title: str,
@@ -148,7 +163,7 @@ class FamilienwohnbauScraper(BaseScraper):
 
         # Generate ID from URL
         # Extract the slug from the URL
-        slug_match = re.search(r"/de/objekt/([^?]+)", url)
+        slug_match = _OBJECT_SLUG_RE.search(url)
         if slug_match:
             slug = slug_match.group(1)
             flat_id = self.generate_id(slug)
@@ -2,9 +2,29 @@
 
 import re
 
+import soupsieve as sv
+from bs4 import BeautifulSoup
+from bs4.filter import SoupStrainer
+
 from wohnung.models import Flat
 from wohnung.scrapers.base import BaseScraper
 
+# Project tiles, the only part of the projects page that is read
+_PROJECT_TILES = SoupStrainer("div", class_=re.compile("ProjectDashboardTile__DashboardTile"))
+
+# Selectors for the tiles and their fields, compiled once; the class names
+# carry generated suffixes, so they are matched by substring
+_TILE_SELECTOR = sv.compile('div[class*="ProjectDashboardTile__DashboardTile"]')
+_LINK_SELECTOR = sv.compile('a[href*="/projekte/"]')
+_ADDRESS_SELECTOR = sv.compile('h2[class*="Address"]')
+_PROPOSAL_SELECTOR = sv.compile('div[class*="ProjectProposalTypes"]')
+_INFO_SELECTOR = sv.compile('div[class*="ProjectOtherInfo"]')
+
+# Postal code + city name (which may be multiple words)
+_LOCATION_RE = re.compile(r"(\d{4}\s+(?:[^\d\s]+(?:\s+[^\d\s]+)?)+)")
+# e.g. "Wohnungen: 12 / 80"
+_UNITS_RE = re.compile(r"Wohnungen:\s*(\d+)\s*/\s*(\d+)")
+
 
 class FriedenScraper(BaseScraper):
     """Scraper for Frieden gemeinnützige housing cooperative."""
@@ -22,19 +42,22 @@ class FriedenScraper(BaseScraper):
     def scrape(self) -> list[Flat]:  # noqa: C901, PLR0912, PLR0915
         """Scrape flats from Frieden."""
         url = self.base_url
-        soup = self.fetch_html(url)
+        response = self.client.get(url)
+        response.raise_for_status()
+
+        soup = BeautifulSoup(
+            response.content, "lxml", from_encoding=response.encoding, parse_only=_PROJECT_TILES
+        )
         flats = []
         seen_urls = set()
 
         # Find all project tiles
-        tiles = soup.find_all(
-            "div", class_=lambda x: x and "ProjectDashboardTile__DashboardTile" in x
-        )
+        tiles = _TILE_SELECTOR.select(soup)
 
         for tile in tiles:
             try:
                 # Get the project link
-                link_tag = tile.find("a", href=lambda x: x and "/projekte/" in x)
+                link_tag = _LINK_SELECTOR.select_one(tile)
                 if not link_tag:
                     continue
 
@@ -48,7 +71,7 @@ class FriedenScraper(BaseScraper):
                 seen_urls.add(full_url)
 
                 # Get the address/title (contains postal code + location + street)
-                address_tag = tile.find("h2", class_=lambda x: x and "Address" in x)
+                address_tag = _ADDRESS_SELECTOR.select_one(tile)
                 if not address_tag:
                     continue
 
@@ -58,7 +81,7 @@ class FriedenScraper(BaseScraper):
                 # Parse location (postal code + city, may include multiple words)
                 location = None
                 # Match postal code + city name (which may be multiple words)
-                location_match = re.match(r"(\d{4}\s+(?:[^\d\s]+(?:\s+[^\d\s]+)?)+)", title_text)
+                location_match = _LOCATION_RE.match(title_text)
                 if location_match:
                     location = location_match.group(1).strip()
 
@@ -66,7 +89,7 @@ class FriedenScraper(BaseScraper):
                     location = title_text
 
                 # Get proposal type (Miete, Kauf, etc.)
-                proposal_tag = tile.find("div", class_=lambda x: x and "ProjectProposalTypes" in x)
+                proposal_tag = _PROPOSAL_SELECTOR.select_one(tile)
                 proposal_type = proposal_tag.get_text(strip=True) if proposal_tag else ""
 
                 # Determine markers
@@ -95,11 +118,11 @@ class FriedenScraper(BaseScraper):
                 markers.append("neubau")
 
                 # Get info about units
-                info_tag = tile.find("div", class_=lambda x: x and "ProjectOtherInfo" in x)
+                info_tag = _INFO_SELECTOR.select_one(tile)
                 if info_tag:
                     info_text = info_tag.get_text(strip=True)
                     # Try to extract unit count
-                    units_match = re.search(r"Wohnungen:\s*(\d+)\s*/\s*(\d+)", info_text)
+                    units_match = _UNITS_RE.search(info_text)
                     if units_match:
                         available = int(units_match.group(1))
                         total = int(units_match.group(2))
@@ -6,12 +6,18 @@ Scrapes projects from https://www.migra.at/neubauprojekte/
 import re
 from datetime import datetime
 
-import requests  # type: ignore[import-untyped]
 from bs4 import BeautifulSoup
+from bs4.filter import SoupStrainer
 
 from wohnung.models import Flat
 from wohnung.scrapers.base import BaseScraper
 
+_SRCSET_ASSET_RE = re.compile(r"(/assets/[^\s]+)")
+
+# The only tags _parse_project reads (with their children); wrappers, scripts
+# and icons in a project's HTML are skipped while parsing
+_PROJECT_TAGS = SoupStrainer(["h2", "h3", "p", "img"])
+
 
 class MigraScraper(BaseScraper):
     """Scraper for Migra housing projects."""
@@ -37,10 +43,7 @@ class MigraScraper(BaseScraper):
         try:
             # Fetch residential projects via lazy list API
             api_url = "https://www.migra.at/neubauprojekte/lazylist/load/ResidentialProjects"
-            response = requests.get(api_url, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
+            data = self.fetch_json(api_url)
             projects = data.get("list", [])
 
             # Parse each project
@@ -71,7 +74,7 @@ class MigraScraper(BaseScraper):
                 return None
 
             # Parse HTML
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, "lxml", parse_only=_PROJECT_TAGS)
 
             # Extract title
             title_elem = soup.find("h2", class_="project__title")
@@ -115,7 +118,7 @@ class MigraScraper(BaseScraper):
                 srcset = img.get("data-srcset", "")  # type: ignore[union-attr]
                 if srcset:
                     # Extract first URL from srcset
-                    match = re.search(r"(/assets/[^\s]+)", str(srcset))  # type: ignore[arg-type]
+                    match = _SRCSET_ASSET_RE.search(str(srcset))  # type: ignore[arg-type]
                     if match:
                         image_url = f"https://www.migra.at{match.group(1)}"
                 else:
@@ -2,12 +2,21 @@
 
 import re
 
-import requests  # type: ignore[import-untyped]
-from bs4 import BeautifulSoup
-
 from wohnung.models import Flat
 from wohnung.scrapers.base import BaseScraper
 
+# Project data with escaped quotes (Next.js format)
+# The pattern matches: \\"name\\":\\"ProjectName\\",...\\"address\\":[\\"Street\\",\\"PostalCode City\\"]
+_PROJECT_RE = re.compile(
+    rb'\\"name\\":\\"([^\\]+)\\",\\"accentColor\\":\\"([^\\]+)\\",\\"badges\\":\[([^\]]+)\],\\"address\\":\[\\"([^\\]+)\\",\\"([^\\]+)\\"\],\\"price\\":\\"([^\\]*)\\",'
+    rb'\\"availability\\":\\"([^\\]+)\\",\\"estatesCount\\":\\"([^\\]+)\\",\\"roomsRange\\":\\"([^\\]+)\\",\\"floorSpaceRange\\":\\"([^\\]+)\\"'
+)
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+# e.g. "38-115 m²"
+_SIZE_RANGE_RE = re.compile(r"(\d+)-(\d+)\s*m")
+# e.g. "1-4 Zimmer"
+_ROOMS_RANGE_RE = re.compile(r"(\d+)-(\d+)\s*Zimmer")
+
 
 class MischekScraper(BaseScraper):
     """Scraper for Mischek projects."""
@@ -29,70 +38,65 @@ class MischekScraper(BaseScraper):
         We extract project information including name, address, price, and details.
         """
         url = f"{self.base_url}/de/projekte"
-        response = requests.get(url, timeout=30)
+        response = self.client.get(url)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        flats = []
-        seen_ids = set()  # Track IDs to avoid duplicates
-
-        # Find all script tags containing Next.js data
-        scripts = soup.find_all("script")
-
-        for script in scripts:
-            if not script.string or "__next_f" not in script.string:
+        content = response.content
+        flats: list[Flat] = []
+
+        # Project data only lives in the Next.js flight data
+        if b"__next_f" not in content:
+            return flats
+
+        encoding = response.encoding or "utf-8"
+        seen_projects = set()  # Track projects to avoid duplicates
+
+        # Look for project data with escaped quotes (Next.js format), scanning
+        # the raw page instead of parsing it
+        for match in _PROJECT_RE.finditer(content):
+            (
+                name,
+                _accent_color,
+                badges,
+                street,
+                postal_city,
+                price,
+                availability,
+                estates_count,
+                rooms_range,
+                floor_space_range,
+            ) = (group.decode(encoding) for group in match.groups())
+
+            # Skip if not a real project (filter out UI elements)
+            if name in ["Custom", "Home"]:
                 continue
 
-            content = script.string
-
-            # Look for project data with escaped quotes (Next.js format)
-            # The pattern matches: \\"name\\":\\"ProjectName\\",...\\"address\\":[\\"Street\\",\\"PostalCode City\\"]
-            pattern = (
-                r'\\"name\\":\\"([^\\]+)\\",\\"accentColor\\":\\"([^\\]+)\\",\\"badges\\":\[([^\]]+)\],\\"address\\":\[\\"([^\\]+)\\",\\"([^\\]+)\\"\],\\"price\\":\\"([^\\]*)\\",'
-                r'\\"availability\\":\\"([^\\]+)\\",\\"estatesCount\\":\\"([^\\]+)\\",\\"roomsRange\\":\\"([^\\]+)\\",\\"floorSpaceRange\\":\\"([^\\]+)\\"'
+            # The flat ID is derived from name and postal city, so duplicates
+            # can be skipped before building them
+            if (name, postal_city) in seen_projects:
+                continue
+            seen_projects.add((name, postal_city))
+
+            # Parse badges - they come as escaped quoted strings
+            # e.g., \\"living\\",\\"subsidised\\"
+            badges_clean = badges.replace('\\"', "").replace('"', "")
+            badges_list = [b.strip() for b in badges_clean.split(",")]
+
+            # Create flat object
+            flat = self._create_flat(
+                name=name,
+                street=street,
+                postal_city=postal_city,
+                price=price,
+                badges=badges_list,
+                estates_count=estates_count,
+                rooms_range=rooms_range,
+                floor_space_range=floor_space_range,
+                _availability=availability,
             )
 
-            matches = re.findall(pattern, content)
-
-            for match in matches:
-                (
-                    name,
-                    accent_color,
-                    badges,
-                    street,
-                    postal_city,
-                    price,
-                    availability,
-                    estates_count,
-                    rooms_range,
-                    floor_space_range,
-                ) = match
-
-                # Skip if not a real project (filter out UI elements)
-                if name in ["Custom", "Home"]:
-                    continue
-
-                # Parse badges - they come as escaped quoted strings
-                # e.g., \\"living\\",\\"subsidised\\"
-                badges_clean = badges.replace('\\"', "").replace('"', "")
-                badges_list = [b.strip() for b in badges_clean.split(",")]
-
-                # Create flat object
-                flat = self._create_flat(
-                    name=name,
-                    street=street,
-                    postal_city=postal_city,
-                    price=price,
-                    badges=badges_list,
-                    estates_count=estates_count,
-                    rooms_range=rooms_range,
-                    floor_space_range=floor_space_range,
-                    _availability=availability,
-                )
-
-                if flat and flat.id not in seen_ids:
-                    seen_ids.add(flat.id)
-                    flats.append(flat)
+            if flat:
+                flats.append(flat)
 
         return flats
 
@@ -117,7 +121,7 @@ class MischekScraper(BaseScraper):
         # Convert name to slug (lowercase, replace spaces with hyphens, handle special chars)
         slug = name.lower()
         slug = slug.replace("ü", "ue").replace("ö", "oe").replace("ä", "ae").replace("ß", "ss")
-        slug = re.sub(r"[^a-z0-9]+", "-", slug).strip("-")
+        slug = _SLUG_RE.sub("-", slug).strip("-")
         url = f"{self.base_url}/de/projekte/{slug}"
 
         # Build location string
@@ -143,7 +147,7 @@ class MischekScraper(BaseScraper):
 
         # Parse size range (e.g., "38-115 m²")
         size = None
-        size_match = re.search(r"(\d+)-(\d+)\s*m", floor_space_range)
+        size_match = _SIZE_RANGE_RE.search(floor_space_range)
         if size_match:
             # Use average of range
             min_size = float(size_match.group(1))
@@ -152,7 +156,7 @@ class MischekScraper(BaseScraper):
 
         # Parse rooms range (e.g., "1-4 Zimmer")
         rooms = None
-        rooms_match = re.search(r"(\d+)-(\d+)\s*Zimmer", rooms_range)
+        rooms_match = _ROOMS_RANGE_RE.search(rooms_range)
         if rooms_match:
             # Use average of range
             min_rooms = float(rooms_match.group(1))
@@ -1,17 +1,28 @@
 """Scraper for NHG - Neue Heimat."""
 
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
 from bs4 import BeautifulSoup
+from bs4.filter import SoupStrainer
 
 from wohnung.models import Flat
 from wohnung.scrapers.base import BaseScraper
 
+# Project items, the only part of the project pages that is read. Matches the
+# class within a multi-valued class attribute, which the strainer sees unsplit
+_PROJECT_ITEMS = SoupStrainer(
+    "div", class_=re.compile(r"(?:^|\s)item(?:\s|$)"), attrs={"data-url": True}
+)
+
 
 class NhgScraper(BaseScraper):
     """Scraper for Neue Heimat projects."""
 
-    def __init__(self) -> None:
+    def __init__(self, client: httpx.Client | None = None) -> None:
         """Initialize NHG scraper with error tracking."""
-        super().__init__()
+        super().__init__(client)
         self._scrape_errors: list[str] = []
 
     @property
@@ -46,14 +57,23 @@ class NhgScraper(BaseScraper):
         # Scrape both planning and construction phases
         pages = [("projekte-in-planung", "in_planning"), ("projekte-in-bau", "neubau")]
 
-        for page_slug, marker in pages:
-            url = f"{self.base_url}/immobilienangebot/{page_slug}/"
+        # Fetch both pages concurrently; they are parsed here in page order
+        with ThreadPoolExecutor(max_workers=len(pages)) as executor:
+            responses = [
+                executor.submit(self._fetch_page, f"{self.base_url}/immobilienangebot/{slug}/")
+                for slug, _ in pages
+            ]
 
+        for (page_slug, marker), pending in zip(pages, responses, strict=True):
             try:
-                response = self.client.get(url)
-                response.raise_for_status()
+                response = pending.result()
 
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = BeautifulSoup(
+                    response.content,
+                    "lxml",
+                    from_encoding=response.encoding,
+                    parse_only=_PROJECT_ITEMS,
+                )
 
                 # Find all project items with data-url
                 items = soup.find_all("div", class_="item", attrs={"data-url": True})
@@ -105,6 +125,12 @@ class NhgScraper(BaseScraper):
 
         return flats
 
+    def _fetch_page(self, url: str) -> httpx.Response:
+        """Fetch a project list page, raising for error responses."""
+        response = self.client.get(url)
+        response.raise_for_status()
+        return response
+
     def _create_flat(
         self, title: str, location: str | None, url: str, image_url: str | None, marker: str
     ) -> Flat | None:
@@ -118,16 +144,9 @@ class NhgScraper(BaseScraper):
         # e.g., "1210 Wien, An der Schanze , 1210 Wien, Simone-Veil-Gasse 11"
         clean_location = location
         if location:
-            # Split by comma and deduplicate
-            parts = [p.strip() for p in location.split(",")]
-            # Keep unique parts while preserving order
-            seen = set()
-            unique_parts = []
-            for part in parts:
-                if part and part not in seen:
-                    seen.add(part)
-                    unique_parts.append(part)
-            clean_location = ", ".join(unique_parts)
+            # Split by comma and keep unique parts while preserving order
+            parts = (p.strip() for p in location.split(","))
+            clean_location = ", ".join(dict.fromkeys(part for part in parts if part))
 
         # Build full image URL if it's relative
         full_image_url = None
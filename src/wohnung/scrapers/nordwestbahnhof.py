@@ -10,9 +10,30 @@ This scraper has special email notification requirements.
 
 import re
 
+from bs4 import Tag
+
 from wohnung.models import Flat
 from wohnung.scrapers.base import BaseScraper
 
+# e.g. "Entwicklungsstufe I"
+_STAGE_RE = re.compile(r"Entwicklungsstufe\s+([IVX]+)")
+# Pattern: "Bauplatz 4: (Baufeld 12) Bauträger: Familienwohnbau Planung: Architect"
+# or just "• Bauplatz 4: ... Bauträger: Name". Captures Bauplatz, Baufeld,
+# Bauträger and Planung; Planung is read in a lookahead so that it does not
+# consume a following Bauplatz
+_BAUPLATZ_RE = re.compile(
+    r"Bauplatz\s+(\d+)[:\s]+(?:\(Baufeld\s+(\d+)\))?\s*Bauträger:\s*([^•\n]+?)"
+    r"(?:\s+Planung:(?=\s*([^•\n]+))|$|•)",
+    re.IGNORECASE,
+)
+_PLANUNG_TRAILER_RE = re.compile(r"\s+Planung:.*$")
+# Project type keywords in a section's lowercased text and their markers
+_SECTION_MARKERS = (
+    ("geförd", "subsidized"),
+    ("freifinanziert", "free_financed"),
+    ("gemeindebau", "gemeindebau"),
+)
+
 
 class NordwestbahnhofScraper(BaseScraper):
     """Scraper for Nordwestbahnhof development area monitoring."""
@@ -45,13 +66,13 @@ class NordwestbahnhofScraper(BaseScraper):
         flats = []
 
         # Find all Entwicklungsstufe sections
-        entwicklungsstufe_headers = soup.find_all(string=re.compile(r"Entwicklungsstufe\s+[IVX]+"))
+        entwicklungsstufe_headers = soup.find_all(string=_STAGE_RE)
 
         self.logger.info(f"Found {len(entwicklungsstufe_headers)} development stage(s)")
 
         for header in entwicklungsstufe_headers:
             # Extract stage number (e.g., "Entwicklungsstufe I")
-            stage_match = re.search(r"Entwicklungsstufe\s+([IVX]+)", header)
+            stage_match = _STAGE_RE.search(header)
             if not stage_match:
                 continue
 
@@ -65,13 +86,12 @@ class NordwestbahnhofScraper(BaseScraper):
             if not header_elem:
                 continue
 
-            # Get all text in this section (until next major header)
+            # Get all text in this section (until next major header), walking
+            # the following siblings once
             section_content = []
-            current = header_elem
-            while current:
-                current = current.find_next_sibling()
-                if not current:
-                    break
+            for current in header_elem.next_siblings:
+                if not isinstance(current, Tag):
+                    continue
                 # Stop at next h2 (new major section)
                 if current.name == "h2":
                     break
@@ -81,20 +101,22 @@ class NordwestbahnhofScraper(BaseScraper):
 
             section_text = " ".join(section_content)
 
-            # Extract Bauplatz → Bauträger mappings
-            # Pattern: "Bauplatz 4: (Baufeld 12) Bauträger: Familienwohnbau"
-            # or just "• Bauplatz 4: ... Bauträger: Name"
-            bauplatz_pattern = r"Bauplatz\s+(\d+)[:\s]+(?:\(Baufeld\s+\d+\))?\s*Bauträger:\s*([^•\n]+?)(?:\s+Planung:|$|•)"
+            # Check project type once for the whole section
+            section_lower = section_text.lower()
+            section_markers = [
+                marker for keyword, marker in _SECTION_MARKERS if keyword in section_lower
+            ]
 
-            matches = re.findall(bauplatz_pattern, section_text, re.IGNORECASE)
+            # Extract Bauplatz → Bauträger mappings
+            matches = _BAUPLATZ_RE.findall(section_text)
 
             self.logger.info(f"Found {len(matches)} Bauplatz assignments in {stage}")
 
-            for bauplatz_num, bautraeger_raw in matches:
+            for bauplatz_num, baufeld, bautraeger_raw, planning in matches:
                 # Clean up bauträger name
                 bautraeger = bautraeger_raw.strip()
                 # Remove trailing "Planung:" if present
-                bautraeger = re.sub(r"\s+Planung:.*$", "", bautraeger)
+                bautraeger = _PLANUNG_TRAILER_RE.sub("", bautraeger)
 
                 # Create a "flat" entry for this assignment
                 flat = self._create_assignment(
@@ -102,7 +124,9 @@ class NordwestbahnhofScraper(BaseScraper):
                     stage_num=stage_num,
                     bauplatz=bauplatz_num,
                     bautraeger=bautraeger,
-                    section_text=section_text,
+                    baufeld=baufeld,
+                    planning=planning,
+                    section_markers=section_markers,
                 )
 
                 if flat:
@@ -111,7 +135,14 @@ class NordwestbahnhofScraper(BaseScraper):
         return flats
 
     def _create_assignment(
-        self, stage: str, stage_num: str, bauplatz: str, bautraeger: str, section_text: str
+        self,
+        stage: str,
+        stage_num: str,
+        bauplatz: str,
+        bautraeger: str,
+        baufeld: str,
+        planning: str,
+        section_markers: list[str],
     ) -> Flat | None:
         """Create a Flat object representing a Bauplatz assignment."""
 
@@ -130,19 +161,13 @@ class NordwestbahnhofScraper(BaseScraper):
         # Extract additional info about the project
         description_parts = [f"{stage}: Bauplatz {bauplatz} wurde an {bautraeger} vergeben."]
 
-        # Try to find Baufeld info
-        baufeld_match = re.search(rf"Bauplatz\s+{bauplatz}[:\s]+\(Baufeld\s+(\d+)\)", section_text)
-        if baufeld_match:
-            baufeld = baufeld_match.group(1)
+        # Add Baufeld info
+        if baufeld:
             description_parts.append(f"Baufeld: {baufeld}")
 
-        # Try to find planning/architecture info
-        planning_match = re.search(
-            rf"Bauplatz\s+{bauplatz}[^•]+?Planung:\s*([^•\n]+)", section_text, re.IGNORECASE
-        )
-        if planning_match:
-            planning = planning_match.group(1).strip()[:200]  # Limit length
-            description_parts.append(f"Planung: {planning}")
+        # Add planning/architecture info
+        if planning:
+            description_parts.append(f"Planung: {planning.strip()[:200]}")  # Limit length
 
         description = " ".join(description_parts)
 
@@ -151,14 +176,8 @@ class NordwestbahnhofScraper(BaseScraper):
         markers.append(f"stufe_{stage_num.lower()}")  # e.g., "stufe_i"
         markers.append("nordwestbahnhof")
 
-        # Check project type
-        section_lower = section_text.lower()
-        if "geförd" in section_lower:
-            markers.append("subsidized")
-        if "freifinanziert" in section_lower:
-            markers.append("free_financed")
-        if "gemeindebau" in section_lower:
-            markers.append("gemeindebau")
+        # Project type of the section
+        markers.extend(section_markers)
 
         return Flat(
             id=flat_id,
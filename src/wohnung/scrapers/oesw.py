@@ -2,6 +2,8 @@
 
 import re
 
+from bs4 import BeautifulSoup
+
 from wohnung.models import Flat
 from wohnung.scrapers.base import BaseScraper
 
@@ -44,22 +46,29 @@ class OeswScraper(BaseScraper):
         project_links = list(project_links[:max_projects])  # type: ignore[assignment]
         self.logger.info(f"Scraping first {len(project_links)} projects (limited for performance)")
 
-        for i, link in enumerate(project_links, 1):
+        # Collect the unique detail pages first so they can be fetched together
+        project_urls = []
+        for link in project_links:
             href = link.get("href", "")
             if not href or href in seen_urls:
                 continue
 
             seen_urls.add(href)
-            full_url = f"{self.base_url}{href}"
+            project_urls.append(f"{self.base_url}{href}")
+
+        pages = self.fetch_html_many(project_urls)
+
+        for i, (full_url, page) in enumerate(zip(project_urls, pages, strict=True), 1):
+            if page is None:
+                continue
 
             try:
-                # Fetch project detail page
-                flat = self._scrape_project(full_url)
+                flat = self._parse_project(full_url, page)
                 if flat:
                     flats.append(flat)
                     if i % 10 == 0:
                         self.logger.info(
-                            f"Progress: {i}/{len(project_links)} projects scraped, {len(flats)} successful"
+                            f"Progress: {i}/{len(project_urls)} projects scraped, {len(flats)} successful"
                         )
             except Exception as e:
                 self.logger.warning(f"Failed to scrape project {full_url}: {e}")
@@ -68,14 +77,8 @@ class OeswScraper(BaseScraper):
         self.logger.info(f"Completed: {len(flats)} projects scraped successfully")
         return flats
 
-    def _scrape_project(self, url: str) -> Flat | None:  # noqa: C901, PLR0912, PLR0915
-        """Scrape a single project detail page."""
-        try:
-            soup = self.fetch_html(url)
-        except Exception as e:
-            self.logger.debug(f"Failed to fetch {url}: {e}")
-            return None
-
+    def _parse_project(self, url: str, soup: BeautifulSoup) -> Flat | None:  # noqa: C901, PLR0912, PLR0915
+        """Parse a single project detail page."""
         # Check for error page
         error_msg = soup.find(string=re.compile(r"Oops, an error occurred!"))
         if error_msg:
@@ -1,10 +1,10 @@
 """Git-optimized per-site storage system."""
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal
 
+import orjson
 from pydantic import BaseModel, ConfigDict, Field
 
 from wohnung.change_detector import ApartmentChange, ChangeDetector
@@ -72,16 +72,15 @@ class SiteStorage:
         if not site_file.exists():
             return None
 
-        with open(site_file, encoding="utf-8") as f:
-            data = json.load(f)
-            # Convert string dates back to datetime
-            for apt_id in data.get("apartments", {}):
-                apt = data["apartments"][apt_id]
-                apt["first_seen"] = datetime.fromisoformat(apt["first_seen"])
-                apt["last_seen"] = datetime.fromisoformat(apt["last_seen"])
-                apt["last_updated"] = datetime.fromisoformat(apt["last_updated"])
-            data["last_scrape"] = datetime.fromisoformat(data["last_scrape"])
-            return SiteStorageData(**data)
+        data = orjson.loads(site_file.read_bytes())
+        # Convert string dates back to datetime
+        for apt_id in data.get("apartments", {}):
+            apt = data["apartments"][apt_id]
+            apt["first_seen"] = datetime.fromisoformat(apt["first_seen"])
+            apt["last_seen"] = datetime.fromisoformat(apt["last_seen"])
+            apt["last_updated"] = datetime.fromisoformat(apt["last_updated"])
+        data["last_scrape"] = datetime.fromisoformat(data["last_scrape"])
+        return SiteStorageData(**data)
 
     def _write_site_data(self, site_data: SiteStorageData) -> None:
         """Write data for a specific site in git-friendly format.
@@ -114,10 +113,12 @@ class SiteStorage:
                 "data": serialized_data,
             }
 
-        # Write with stable formatting
-        with open(site_file, "w", encoding="utf-8") as f:
-            json.dump(data_dict, f, indent=2, ensure_ascii=False, sort_keys=True)
-            f.write("\n")  # Trailing newline for git
+        # Write with stable formatting; orjson's 2-space indent and sorted keys
+        # produce the same bytes as json.dump(indent=2, sort_keys=True)
+        site_file.write_bytes(
+            orjson.dumps(data_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+            + b"\n"  # Trailing newline for git
+        )
 
     def _serialize_data(self, data: dict[str, Any]) -> dict[str, Any]:
         """Recursively serialize data, converting datetimes to ISO format.
@@ -321,8 +322,7 @@ class SiteStorage:
         if not legacy_file.exists():
             return
 
-        with open(legacy_file, encoding="utf-8") as f:
-            legacy_data = json.load(f)
+        legacy_data = orjson.loads(legacy_file.read_bytes())
 
         now = datetime.now()
         flats_by_site: dict[str, list[Flat]] = {}
@@ -395,7 +395,7 @@ class SiteStorage:
         history_file = self.data_dir / f"{site_name}_history.jsonl"
 
         # Append changes to JSONL file (one JSON per line)
-        with open(history_file, "a", encoding="utf-8") as f:
+        with open(history_file, "ab") as f:
             for change in changes:
                 # Serialize change to JSON
                 change_dict = {
@@ -405,7 +405,7 @@ class SiteStorage:
                     "changes": change.changes,
                     "apartment_data": change.apartment_data,
                 }
-                f.write(json.dumps(change_dict, ensure_ascii=False) + "\n")
+                f.write(orjson.dumps(change_dict) + b"\n")
 
     def get_change_history(self, site_name: str, limit: int | None = None) -> list[ApartmentChange]:
         """Get change history for a site.
@@ -424,12 +424,12 @@ class SiteStorage:
 
         changes: list[ApartmentChange] = []
 
-        with open(history_file, encoding="utf-8") as f:
+        with open(history_file, "rb") as f:
             for line in f:
                 if not line.strip():
                     continue
 
-                data = json.loads(line)
+                data = orjson.loads(line)
                 # Convert timestamp back to datetime
                 data["timestamp"] = datetime.fromisoformat(data["timestamp"])
 
@@ -1,10 +1,11 @@
 """JSON-based storage for tracking seen flats."""
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from wohnung.config import settings
 from wohnung.models import Flat
 
@@ -30,14 +31,12 @@ class JSONStorage:
 
     def _read_data(self) -> dict[str, Any]:
         """Read data from storage file."""
-        with open(self.storage_file, encoding="utf-8") as f:
-            data: dict[str, Any] = json.load(f)
-            return data
+        data: dict[str, Any] = orjson.loads(self.storage_file.read_bytes())
+        return data
 
     def _write_data(self, data: dict[str, Any]) -> None:
         """Write data to storage file."""
-        with open(self.storage_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        self.storage_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
     def flat_exists(self, flat_id: str) -> bool:
         """
@@ -0,0 +1,51 @@
+"""Tests for ARWAG scraper."""
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from wohnung.scrapers.arwag import ArwagScraper
+
+API_URL = "https://www.arwag.at/projekte/lazylist/load/ResidentialProjectGroups"
+
+
+@pytest.fixture
+def sample_project_view() -> str:
+    """Sample project HTML as embedded in the lazy list API."""
+    return """
+    <div class="app-ObjectGridEntry">
+        <a class="app-ObjectGridEntry-Link" href="/projekte/markhofgasse-11/">
+            <div class="app-ObjectGridEntry-ImageContainer">
+                <img class="app-ObjectGridEntry-ImageContainer-image lazyload"
+                     data-srcset="/assets/markhof-400.jpg 400w, /assets/markhof-800.jpg 800w" />
+            </div>
+            <div class="app-ObjectGridEntry-content">
+                <h2 class="app-ObjectGridEntry-headline">Wohnen am Markhof</h2>
+                <p class="app-ObjectGridEntry-address">1030 Wien - <span>Markhofgasse 11</span></p>
+                <em>Miete</em>
+            </div>
+        </a>
+        <script>window.dataLayer = [];</script>
+    </div>
+    """
+
+
+class TestArwagScraper:
+    """Tests for ArwagScraper."""
+
+    def test_scrape_projects(self, httpx_mock: HTTPXMock, sample_project_view: str) -> None:
+        """Test that projects from the lazy list API are parsed into flats."""
+        httpx_mock.add_response(
+            url=API_URL,
+            json={"list": [{"id": "1", "view": sample_project_view}, {"id": "2", "view": ""}]},
+        )
+
+        flats = ArwagScraper().scrape()
+
+        assert len(flats) == 1
+        flat = flats[0]
+        assert flat.title == "Wohnen am Markhof"
+        assert str(flat.url) == "https://www.arwag.at/projekte/markhofgasse-11/"
+        assert flat.location == "1030 Wien"
+        assert flat.description == "Miete, Markhofgasse 11"
+        assert str(flat.image_url) == "https://www.arwag.at/assets/markhof-400.jpg"
+        assert flat.markers == ["rental"]
@@ -0,0 +1,52 @@
+"""Tests for at home scraper."""
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from wohnung.scrapers.athome import AthomeScraper
+
+
+@pytest.fixture
+def sample_projects_html() -> str:
+    """Sample at home project index page."""
+    return """
+    <html>
+    <body>
+        <nav><a class="menu-item" href="https://athome.at/kontakt/">Kontakt</a></nav>
+        <div class="project-grid">
+            <a class="project-grid-item is-active" href="https://athome.at/projekt/wohnen-am-park/">
+                <div class="project-grid-item-image"
+                     style="background-image: url(https://athome.at/img/park.jpg)"></div>
+                <div class="project-grid-item-title">Wohnen am Park</div>
+                <div class="project-grid-item-address">1100 Wien, Parkweg 1</div>
+                <div class="project-grid-item-subline">Mietkauf</div>
+            </a>
+            <a class="project-grid-item" href="https://athome.at/projekt/stadtblick/">
+                <div class="project-grid-item-title">Stadtblick</div>
+                <div class="project-grid-item-address">1210 Wien</div>
+                <div class="project-grid-item-subline">Eigentum</div>
+            </a>
+            <a class="project-grid-item" href="https://athome.at/coming-soon/"></a>
+        </div>
+    </body>
+    </html>
+    """
+
+
+class TestAthomeScraper:
+    """Tests for AthomeScraper."""
+
+    def test_scrape_projects(self, httpx_mock: HTTPXMock, sample_projects_html: str) -> None:
+        """Test that every project grid item is parsed, including multi-class items."""
+        httpx_mock.add_response(url="https://athome.at/projekte/", text=sample_projects_html)
+
+        flats = AthomeScraper().scrape()
+
+        assert [flat.id for flat in flats] == ["wohnen-am-park", "stadtblick"]
+        park, stadtblick = flats
+        assert park.title == "Wohnen am Park"
+        assert park.location == "1100 Wien, Parkweg 1"
+        assert str(park.image_url) == "https://athome.at/img/park.jpg"
+        assert park.markers == ["rental", "rent_to_own", "neubau"]
+        assert stadtblick.image_url is None
+        assert stadtblick.markers == ["for_sale", "neubau"]
@@ -0,0 +1,62 @@
+"""Tests for BWSG scraper."""
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from wohnung.scrapers.bwsg import BwsgScraper
+
+SEARCH_URL = (
+    "https://www.bwsg.at/immobilien/immobilie-suchen/"
+    "?_objektart=haus%2Cwohnung&_finanzierung=gefoerdert"
+)
+
+
+@pytest.fixture
+def sample_search_html() -> str:
+    """Sample BWSG search result page."""
+    return """
+    <html>
+    <body>
+        <header><a href="https://www.bwsg.at/kontakt/">Kontakt</a></header>
+        <div class="res_immobiliensuche__immobilien">
+            <div class="res_immobiliensuche__immobilien__col" data-objektnummer="W/1234">
+                <a class="res_immobiliensuche__immobilien__item"
+                   href="https://www.bwsg.at/immobilie/w-1234/">
+                    <img src="https://www.bwsg.at/uploads/w-1234.jpg" />
+                    <h2 class="res_immobiliensuche__immobilien__item__content__title">
+                        Wohnen im Grünen
+                    </h2>
+                    <span class="res_immobiliensuche__immobilien__item__content__meta__location"
+                        ><i class="icon-pin"></i>2500Baden</span>
+                    <span class="res_immobiliensuche__immobilien__item__content__meta__preis"
+                        >€ 845,20</span>
+                </a>
+            </div>
+            <div class="res_immobiliensuche__immobilien__col" data-objektnummer="">
+                <a class="res_immobiliensuche__immobilien__item" href="https://www.bwsg.at/x/">
+                    Ohne Objektnummer
+                </a>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+
+
+class TestBwsgScraper:
+    """Tests for BwsgScraper."""
+
+    def test_scrape_properties(self, httpx_mock: HTTPXMock, sample_search_html: str) -> None:
+        """Test that property containers are parsed into flats."""
+        httpx_mock.add_response(url=SEARCH_URL, text=sample_search_html)
+
+        flats = BwsgScraper().scrape()
+
+        assert len(flats) == 1
+        flat = flats[0]
+        assert flat.id == "W-1234"
+        assert flat.title == "Wohnen im Grünen"
+        assert flat.location == "2500 Baden"
+        assert flat.price == 845.20
+        assert str(flat.image_url) == "https://www.bwsg.at/uploads/w-1234.jpg"
+        assert flat.markers == ["subsidized", "rental"]
@@ -0,0 +1,146 @@
+"""Tests for EBG scraper."""
+
+import pytest
+from bs4 import BeautifulSoup
+from pytest_httpx import HTTPXMock
+
+from wohnung.scrapers.ebg import EbgScraper
+
+BASE_URL = "https://www.ebg-wohnen.at"
+
+
+@pytest.fixture
+def sample_index_html() -> str:
+    """Sample EBG in-planning project list."""
+    return """
+    <html>
+    <body>
+        <div><a href="/in-planung/projekte/detail/1">Wohnpark Süd</a></div>
+        <div>
+            <h3>Am Mühlbach</h3>
+            <a href="/in-planung/projekte/detail/2">MIETE</a>
+        </div>
+        <div><a href="/in-planung/projekte/detail/1">Wohnpark Süd</a></div>
+        <div><a href="/in-planung/projekte/detail/3">Nicht erreichbar</a></div>
+    </body>
+    </html>
+    """
+
+
+def detail_html(title: str) -> str:
+    """Sample EBG project detail page."""
+    return f"""
+    <html>
+    <body>
+        <main>
+            <div>
+                <h3>{title}</h3>
+                <span>1100 Wien</span>
+                <span>Favoritenstraße 1</span>
+            </div>
+            <div>
+                <h4>BESCHREIBUNG</h4>
+                <p>Es entstehen 120 Wohnungen, gefördert und barrierefrei errichtet.</p>
+                <p>Geplanter Bezug: Herbst 2028</p>
+            </div>
+        </main>
+    </body>
+    </html>
+    """
+
+
+class TestEbgScraper:
+    """Tests for EbgScraper."""
+
+    def test_scrape_projects(self, httpx_mock: HTTPXMock, sample_index_html: str) -> None:
+        """Test that each unique project page is fetched and parsed, skipping failures."""
+        httpx_mock.add_response(url=f"{BASE_URL}/in-planung/projekte", text=sample_index_html)
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/in-planung/projekte/detail/1", text=detail_html("Wohnpark Süd")
+        )
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/in-planung/projekte/detail/2", text=detail_html("Am Mühlbach")
+        )
+        httpx_mock.add_response(url=f"{BASE_URL}/in-planung/projekte/detail/3", status_code=500)
+
+        flats = EbgScraper().scrape()
+
+        assert [flat.title for flat in flats] == [
+            "Wohnpark Süd (120 Wohnungen)",
+            "Am Mühlbach (120 Wohnungen)",
+        ]
+        flat = flats[0]
+        assert str(flat.url) == f"{BASE_URL}/in-planung/projekte/detail/1"
+        assert flat.location == "1100 Wien Favoritenstraße 1"
+        assert flat.description == (
+            "Geplanter Bezug: Herbst 2028. Es entstehen 120 Wohnungen, gefördert und "
+            "barrierefrei errichtet. Geplanter Bezug: Herbst 2028"
+        )
+        assert flat.markers == ["in_planning", "rental", "subsidized", "accessible"]
+
+    def test_scrape_survives_broken_detail_page(
+        self, httpx_mock: HTTPXMock, sample_index_html: str
+    ) -> None:
+        """Test that a non-HTTP error on one detail page only drops that project."""
+        httpx_mock.add_response(url=f"{BASE_URL}/in-planung/projekte", text=sample_index_html)
+        httpx_mock.add_exception(
+            ValueError("undecodable page"), url=f"{BASE_URL}/in-planung/projekte/detail/1"
+        )
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/in-planung/projekte/detail/2", text=detail_html("Am Mühlbach")
+        )
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/in-planung/projekte/detail/3", text=detail_html("Nordbahnhof")
+        )
+
+        flats = EbgScraper().scrape()
+
+        assert [flat.title for flat in flats] == [
+            "Am Mühlbach (120 Wohnungen)",
+            "Nordbahnhof (120 Wohnungen)",
+        ]
+
+    def test_description_falls_back_to_long_paragraphs(self) -> None:
+        """Test that pages without a BESCHREIBUNG section use their first long paragraphs."""
+        soup = BeautifulSoup(
+            """
+            <html><body><main>
+                <h3>Wohnpark Nord</h3>
+                <p>Kurz.</p>
+                <div><p>Im Norden entstehen 80 Wohnungen in ruhiger Lage nahe dem Park.</p></div>
+                <p>Alle Wohnungen verfügen über Balkon, Loggia oder einen Eigengarten.</p>
+                <p>Dieser dritte lange Absatz wird nicht mehr in die Beschreibung übernommen.</p>
+            </main></body></html>
+            """,
+            "lxml",
+        )
+
+        flat = EbgScraper()._parse_project(f"{BASE_URL}/in-planung/projekte/detail/4", soup)
+
+        assert flat is not None
+        assert flat.description == (
+            "Im Norden entstehen 80 Wohnungen in ruhiger Lage nahe dem Park. "
+            "Alle Wohnungen verfügen über Balkon, Loggia oder einen Eigengarten."
+        )
+
+    def test_location_from_page_text(self) -> None:
+        """Test that the location is found in the page text after the navigation."""
+        navigation = "Startseite Projekte Kontakt " * 10
+        soup = BeautifulSoup(
+            f"""
+            <html><body><main>
+                <nav>{navigation}</nav>
+                <p>Projekt in 1220 Wien Seestadt Aspern</p>
+                <p>{"Weitere Informationen folgen. " * 100}</p>
+            </main></body></html>
+            """,
+            "lxml",
+        )
+
+        flat = EbgScraper()._parse_project(
+            f"{BASE_URL}/in-planung/projekte/detail/5", soup, "Seeterrassen"
+        )
+
+        assert flat is not None
+        assert flat.title == "Seeterrassen"
+        assert flat.location.startswith("1220 Wien Seestadt Aspern")
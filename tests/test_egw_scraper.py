@@ -0,0 +1,52 @@
+"""Tests for EGW scraper."""
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from wohnung.scrapers.egw import EgwScraper
+
+PROJECTS_URL = "https://www.egw.at/projekte"
+
+
+@pytest.fixture
+def sample_projects_html() -> str:
+    """Sample EGW project page with the embedded projects array."""
+    return """
+    <html>
+    <body>
+        <script>var config = [];</script>
+        <script>var projects = [
+            {"url": "/projekte/wohnen-am-see/", "heading": "Wohnen am See",
+             "location": "2700 Wiener Neustadt", "projectstatus": "planning"},
+            {"url": "/projekte/stadtquartier/", "heading": "Stadtquartier",
+             "location": "1030 Wien", "projectstatus": "selling"},
+            {"url": "", "heading": "Ohne Link"}
+        ];</script>
+    </body>
+    </html>
+    """
+
+
+class TestEgwScraper:
+    """Tests for EgwScraper."""
+
+    def test_scrape_projects(self, httpx_mock: HTTPXMock, sample_projects_html: str) -> None:
+        """Test that the embedded projects array is parsed into flats."""
+        httpx_mock.add_response(url=PROJECTS_URL, text=sample_projects_html)
+
+        flats = EgwScraper().scrape()
+
+        assert [flat.id for flat in flats] == ["projekte-wohnen-am-see", "projekte-stadtquartier"]
+        see, quartier = flats
+        assert see.title == "Wohnen am See"
+        assert see.location == "2700 Wiener Neustadt"
+        assert str(see.url) == "https://www.egw.at/projekte/wohnen-am-see/"
+        assert see.markers == ["in_planning"]
+        assert quartier.markers == ["in_vergabe"]
+
+    def test_scrape_missing_projects(self, httpx_mock: HTTPXMock) -> None:
+        """Test that a page without the projects array raises."""
+        httpx_mock.add_response(url=PROJECTS_URL, text="<html><script>var x = [];</script></html>")
+
+        with pytest.raises(ValueError, match="Could not find projects data"):
+            EgwScraper().scrape()
@@ -1,17 +1,21 @@
 """Tests for enhanced email notifications."""
 
+import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
 
 import pytest
+from pytest_httpx import HTTPXMock
 
 from wohnung.change_detector import ApartmentChange
 from wohnung.email import (
     generate_changes_email_html,
+    generate_consolidated_email_html,
     preview_changes_email,
     send_changes_email,
 )
+from wohnung.models import ScraperResult
 
 
 @pytest.fixture
@@ -196,6 +200,15 @@ class TestGenerateChangesEmailHTML:
 
         assert "📈 Price Up" in html or "price" in html.lower()
 
+    def test_price_change_percentages(self, sample_updated_change: ApartmentChange):
+        """Test the signed percentage shown for price drops and increases."""
+        html = generate_changes_email_html([sample_updated_change])
+        assert "Price Drop: -8.3%" in html
+
+        sample_updated_change.changes["price"] = (1000.0, 1200.0)
+        html = generate_changes_email_html([sample_updated_change])
+        assert "Price Up: +20.0%" in html
+
     def test_change_highlights(self, sample_updated_change: ApartmentChange):
         """Test change highlights are displayed for updates."""
         html = generate_changes_email_html([sample_updated_change])
@@ -229,6 +242,22 @@ class TestGenerateChangesEmailHTML:
         assert "<body>" in html
         assert "</body>" in html
 
+    def test_timestamp_format(self, sample_new_change: ApartmentChange):
+        """Test that the detection timestamp is rendered as DD.MM.YYYY HH:MM."""
+        sample_new_change.timestamp = datetime(2024, 3, 5, 7, 9)
+
+        html = generate_changes_email_html([sample_new_change])
+
+        assert "Erkannt: 05.03.2024 07:09" in html
+
+    def test_description_ellipsis_only_when_truncated(self, sample_new_change: ApartmentChange):
+        """Test that only descriptions longer than 200 characters get an ellipsis."""
+        sample_new_change.apartment_data["description"] = "Kurz"
+        assert "Kurz</p>" in generate_changes_email_html([sample_new_change])
+
+        sample_new_change.apartment_data["description"] = "x" * 250
+        assert f"{'x' * 200}...</p>" in generate_changes_email_html([sample_new_change])
+
     def test_css_styles_included(self, sample_new_change: ApartmentChange):
         """Test that CSS styles are included."""
         html = generate_changes_email_html([sample_new_change])
@@ -282,6 +311,79 @@ class TestSendChangesEmail:
         assert "1 updated" in captured.out
 
 
+class TestSendViaResendApi:
+    """Tests for posting emails to the Resend API."""
+
+    RESEND_URL = "https://api.resend.com/emails"
+
+    @pytest.fixture
+    def two_accounts(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Configure two numbered Resend accounts."""
+        monkeypatch.setenv("RESEND_API_KEY_1", "re_key_1")
+        monkeypatch.setenv("EMAIL_TO_1", "one@example.com")
+        monkeypatch.setenv("RESEND_API_KEY_2", "re_key_2")
+        monkeypatch.setenv("EMAIL_TO_2", "two@example.com")
+
+    def test_posts_once_per_account(
+        self, two_accounts, httpx_mock: HTTPXMock, sample_new_change: ApartmentChange
+    ):
+        """Test that each account posts the same body to its own recipient."""
+        httpx_mock.add_response(url=self.RESEND_URL, method="POST", json={"id": "e1"})
+        httpx_mock.add_response(url=self.RESEND_URL, method="POST", json={"id": "e2"})
+
+        assert send_changes_email([sample_new_change]) is True
+
+        requests = httpx_mock.get_requests()
+        assert len(requests) == 2
+        auth = sorted(r.headers["Authorization"] for r in requests)
+        assert auth == ["Bearer re_key_1", "Bearer re_key_2"]
+        bodies = [json.loads(r.content) for r in requests]
+        assert sorted(b["to"][0] for b in bodies) == ["one@example.com", "two@example.com"]
+        assert bodies[0]["html"] == bodies[1]["html"]
+        assert "Beautiful 3-Room Apartment" in bodies[0]["html"]
+
+    def test_shared_recipient_gets_one_email(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        httpx_mock: HTTPXMock,
+        sample_new_change: ApartmentChange,
+    ):
+        """Test that accounts with the same recipient result in a single post."""
+        monkeypatch.setenv("RESEND_API_KEY_1", "re_key_1")
+        monkeypatch.setenv("EMAIL_TO_1", "same@example.com")
+        monkeypatch.setenv("RESEND_API_KEY_2", "re_key_2")
+        monkeypatch.setenv("EMAIL_TO_2", "same@example.com")
+        httpx_mock.add_response(url=self.RESEND_URL, method="POST", json={"id": "e1"})
+
+        assert send_changes_email([sample_new_change]) is True
+
+        requests = httpx_mock.get_requests()
+        assert len(requests) == 1
+        assert requests[0].headers["Authorization"] == "Bearer re_key_1"
+
+    def test_failed_account_reports_failure(
+        self, two_accounts, httpx_mock: HTTPXMock, sample_new_change: ApartmentChange, capsys
+    ):
+        """Test that an API error for one account marks the send as failed."""
+        httpx_mock.add_response(url=self.RESEND_URL, method="POST", json={"id": "e1"})
+        httpx_mock.add_response(url=self.RESEND_URL, method="POST", status_code=403, json={})
+
+        assert send_changes_email([sample_new_change]) is False
+        assert "❌ Error sending email" in capsys.readouterr().out
+
+    def test_prerendered_html_is_sent_as_is(
+        self, two_accounts, httpx_mock: HTTPXMock, sample_new_change: ApartmentChange
+    ):
+        """Test that prerendered HTML is reused instead of rendering again."""
+        httpx_mock.add_response(url=self.RESEND_URL, method="POST", json={"id": "e1"})
+        httpx_mock.add_response(url=self.RESEND_URL, method="POST", json={"id": "e2"})
+
+        assert send_changes_email([sample_new_change], prerendered_html="<p>preview</p>") is True
+
+        bodies = [json.loads(r.content) for r in httpx_mock.get_requests()]
+        assert [b["html"] for b in bodies] == ["<p>preview</p>", "<p>preview</p>"]
+
+
 class TestPreviewChangesEmail:
     """Tests for preview_changes_email function."""
 
@@ -426,3 +528,32 @@ class TestChangeHighlights:
 
         html = generate_changes_email_html([change])
         assert "Title was updated" in html or "title" in html.lower()
+
+
+class TestHtmlEscaping:
+    """Tests for escaping of scraped fields in generated HTML."""
+
+    def test_changes_email_escapes_title(self, sample_new_change: ApartmentChange):
+        """Test that markup in scraped titles is escaped."""
+        sample_new_change.apartment_data["title"] = "<script>alert(1)</script>"
+
+        html = generate_changes_email_html([sample_new_change])
+
+        assert "<script>" not in html
+        assert "&lt;script&gt;" in html
+
+    def test_consolidated_email_escapes_fields(self, sample_new_change: ApartmentChange):
+        """Test that the consolidated email escapes titles, markers and errors."""
+        sample_new_change.apartment_data["title"] = "Haus <b>A</b>"
+        sample_new_change.apartment_data["markers"] = ["<i>neu</i>"]
+        result = ScraperResult(
+            source="test-site",
+            errors=["<img src=x>"],
+            health_status="failed",
+        )
+
+        html = generate_consolidated_email_html([sample_new_change], [result])
+
+        assert "Haus &lt;b&gt;A&lt;/b&gt;" in html
+        assert "&lt;i&gt;neu&lt;/i&gt;" in html
+        assert "&lt;img src=x&gt;" in html
@@ -0,0 +1,49 @@
+"""Tests for Familienwohnbau scraper."""
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from wohnung.scrapers.familienwohnbau import FamilienwohnbauScraper
+
+
+@pytest.fixture
+def sample_projects_html() -> str:
+    """Sample Familienwohnbau projects page."""
+    return """
+    <html>
+    <body>
+        <a href="/de/kontakt">Kontakt</a>
+        <a href="/de/objekt/floridsdorf-miete">
+            <img src="https://familienwohnbau.at/img/1.jpg"
+                 alt="1210 Wien, Brünner Straße 12 MIETE" />
+            Ab € 1.234,50 Anzahl der Einheiten: 42
+        </a>
+        <a href="/de/objekt/tiefgarage">
+            <img src="https://familienwohnbau.at/img/2.jpg" alt="1210 Wien, Tiefgarage" />
+        </a>
+        <a href="/de/objekt/baden-eigentum">2500 Baden Eigentum Ab € 300.000</a>
+    </body>
+    </html>
+    """
+
+
+class TestFamilienwohnbauScraper:
+    """Tests for FamilienwohnbauScraper."""
+
+    def test_scrape_projects(self, httpx_mock: HTTPXMock, sample_projects_html: str) -> None:
+        """Test that object links are parsed and parking listings are skipped."""
+        httpx_mock.add_response(
+            url="https://familienwohnbau.at/de/projekte", text=sample_projects_html
+        )
+
+        flats = FamilienwohnbauScraper().scrape()
+
+        assert len(flats) == 2
+        rental, sale = flats
+        assert rental.title == "1210 Wien, Brünner Straße 12 MIETE (42 Einheiten)"
+        assert rental.location == "1210 Wien, Brünner Straße 12"
+        assert rental.price == 1234.50
+        assert rental.markers == ["rental", "subsidized"]
+        assert sale.location == "2500 Baden Eigentum"
+        assert sale.price == 300000.0
+        assert sale.markers == ["for_sale", "subsidized"]
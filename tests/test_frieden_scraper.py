@@ -0,0 +1,57 @@
+"""Tests for Frieden scraper."""
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from wohnung.scrapers.frieden import FriedenScraper
+
+
+@pytest.fixture
+def sample_projects_html() -> str:
+    """Sample Frieden project dashboard."""
+    return """
+    <html>
+    <body>
+        <header><a href="/projekte/alle">Alle Projekte</a></header>
+        <div class="ProjectDashboardTile__DashboardTile-sc-1abc xyz">
+            <a href="/projekte/seestadt-nord?ref=dashboard">
+                <h2 class="ProjectDashboardTile__Address-sc-2def">1220 Wien<br/>Seestadt Nord 5</h2>
+                <div class="ProjectDashboardTile__ProjectProposalTypes-sc-3ghi">
+                    Miete mit Kaufoption
+                </div>
+                <div class="ProjectDashboardTile__ProjectOtherInfo-sc-4jkl">Wohnungen: 12 / 80</div>
+            </a>
+        </div>
+        <div class="ProjectDashboardTile__DashboardTile-sc-1abc">
+            <a href="/projekte/seestadt-nord">
+                <h2 class="ProjectDashboardTile__Address-sc-2def">1220 Wien Seestadt Nord 5</h2>
+            </a>
+        </div>
+        <div class="ProjectDashboardTile__DashboardTile-sc-1abc">
+            <a href="/projekte/bad-voeslau">
+                <h2 class="ProjectDashboardTile__Address-sc-2def">2540 Bad Vöslau</h2>
+                <div class="ProjectDashboardTile__ProjectProposalTypes-sc-3ghi">Kauf</div>
+            </a>
+        </div>
+    </body>
+    </html>
+    """
+
+
+class TestFriedenScraper:
+    """Tests for FriedenScraper."""
+
+    def test_scrape_projects(self, httpx_mock: HTTPXMock, sample_projects_html: str) -> None:
+        """Test that project tiles are parsed and duplicate projects skipped."""
+        httpx_mock.add_response(url="https://www.frieden.at/projekte", text=sample_projects_html)
+
+        flats = FriedenScraper().scrape()
+
+        assert len(flats) == 2
+        seestadt, voeslau = flats
+        assert str(seestadt.url) == "https://www.frieden.at/projekte/seestadt-nord"
+        assert seestadt.title == "1220 Wien Seestadt Nord 5 (12/80 verfügbar)"
+        assert seestadt.location == "1220 Wien Seestadt"
+        assert seestadt.markers == ["rental", "for_sale", "subsidized", "neubau"]
+        assert voeslau.location == "2540 Bad Vöslau"
+        assert voeslau.markers == ["for_sale", "subsidized", "neubau"]
@@ -3,6 +3,7 @@
 import pytest
 from pydantic import HttpUrl
 
+import wohnung.marker_detector
 from wohnung.marker_detector import MarkerDetector
 from wohnung.models import Flat
 from wohnung.site_config import MarkerConfig
@@ -102,6 +103,15 @@ class TestMarkerDetector:
         assert detector.markers[0].priority == "high"
         assert detector.markers[-1].priority == "medium"
 
+    def test_priority_sort_keeps_config_order(self, sample_markers: list[MarkerConfig]) -> None:
+        """Test that markers with equal priority keep their configured order."""
+        detector = MarkerDetector(sample_markers)
+
+        names = [marker.name for marker in detector.markers]
+        high = [m.name for m in sample_markers if m.priority == "high"]
+        medium = [m.name for m in sample_markers if m.priority == "medium"]
+        assert names == high + medium
+
     def test_detect_marker_in_description(self, sample_markers: list[MarkerConfig]) -> None:
         """Test detecting marker in German description text."""
         detector = MarkerDetector(sample_markers)
@@ -508,6 +518,78 @@ class TestMarkerDetector:
         detected = detector.detect_markers(flat)
         assert "bad_regex" in detected  # Matches "valid" pattern
 
+    def test_shared_substring_across_markers(self) -> None:
+        """Test that a substring used by several markers respects each one's fields."""
+        markers = [
+            MarkerConfig(
+                name="in_title",
+                label="In Title",
+                patterns=["sofort"],
+                priority="high",
+                search_in=["title"],
+            ),
+            MarkerConfig(
+                name="anywhere",
+                label="Anywhere",
+                patterns=["sofort", "frei ab \\d+"],
+                priority="low",
+            ),
+        ]
+
+        detector = MarkerDetector(markers)
+
+        flat = Flat(
+            id="test-23",
+            title="Wohnung",
+            url=HttpUrl("https://example.com/23"),
+            location="Wien",
+            description="Sofort beziehbar",
+            source="test",
+        )
+
+        assert detector.detect_markers(flat) == ["anywhere"]
+
+    def test_detection_without_ahocorasick(
+        self, monkeypatch: pytest.MonkeyPatch, sample_markers: list[MarkerConfig]
+    ) -> None:
+        """Test that substring markers still match when pyahocorasick is missing."""
+        monkeypatch.setattr(wohnung.marker_detector, "ahocorasick", None)
+        detector = MarkerDetector(sample_markers)
+
+        flat = Flat(
+            id="test-24",
+            title="Wohnung",
+            url=HttpUrl("https://example.com/24"),
+            location="Wien",
+            description="Vormerkung möglich ab März.",
+            source="test",
+        )
+
+        assert "vormerkung_possible" in detector.detect_markers(flat)
+
+    def test_patterns_that_cannot_be_combined(self) -> None:
+        """Test that patterns which cannot be combined into one regex still match."""
+        markers = [
+            MarkerConfig(
+                name="clash",
+                label="Clash",
+                patterns=["(?s)ab sofort", "frei ab \\d+"],
+                priority="low",
+            ),
+        ]
+
+        detector = MarkerDetector(markers)
+
+        flat = Flat(
+            id="test-22",
+            title="Frei ab 2026",
+            url=HttpUrl("https://example.com/22"),
+            location="Wien",
+            source="test",
+        )
+
+        assert detector.detect_markers(flat) == ["clash"]
+
 
 class TestMarkerIntegration:
     """Integration tests for marker functionality."""
@@ -0,0 +1,56 @@
+"""Tests for Migra scraper."""
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from wohnung.scrapers.migra import MigraScraper
+
+API_URL = "https://www.migra.at/neubauprojekte/lazylist/load/ResidentialProjects"
+
+
+@pytest.fixture
+def sample_project_view() -> str:
+    """Sample project HTML as embedded in the lazy list API."""
+    return """
+    <article class="project">
+        <figure>
+            <img class="project__img lazyload"
+                 data-srcset="/assets/attems-400.jpg 400w, /assets/attems-800.jpg 800w" />
+        </figure>
+        <div class="project__content">
+            <h2 class="project__title"><a href="/neubauprojekte/attemsgasse/">"Attemsgasse"</a></h2>
+            <h3 role="doc-subtitle">Geförderte Miete</h3>
+            <p>1220 Wien • Attemsgasse 34</p>
+        </div>
+        <script>window.dataLayer = [];</script>
+    </article>
+    """
+
+
+class TestMigraScraper:
+    """Tests for MigraScraper."""
+
+    def test_scrape_projects(self, httpx_mock: HTTPXMock, sample_project_view: str) -> None:
+        """Test that projects from the lazy list API are parsed into flats."""
+        httpx_mock.add_response(
+            url=API_URL,
+            json={
+                "list": [
+                    {"id": "1", "view": sample_project_view},
+                    {"id": "2", "view": ""},
+                    {"id": "3", "view": sample_project_view.replace("attems", "seestadt")},
+                ]
+            },
+        )
+
+        flats = MigraScraper().scrape()
+
+        assert len(flats) == 2
+        assert str(flats[1].url) == "https://www.migra.at/neubauprojekte/seestadtgasse/"
+        flat = flats[0]
+        assert flat.title == "Attemsgasse"
+        assert str(flat.url) == "https://www.migra.at/neubauprojekte/attemsgasse/"
+        assert flat.location == "1220 Wien"
+        assert flat.description == "Geförderte Miete, Attemsgasse 34"
+        assert str(flat.image_url) == "https://www.migra.at/assets/attems-400.jpg"
+        assert flat.markers == ["rental", "subsidized"]
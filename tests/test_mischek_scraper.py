@@ -0,0 +1,60 @@
+"""Tests for Mischek scraper."""
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from wohnung.scrapers.mischek import MischekScraper
+
+
+def project_json(name: str, badges: str = r"\"living\",\"subsidised\"") -> str:
+    """Project data as escaped JSON inside a Next.js __next_f push."""
+    return (
+        rf"\"name\":\"{name}\",\"accentColor\":\"#00aa88\",\"badges\":[{badges}],"
+        r"\"address\":[\"Donaufelder Straße 101\",\"1210 Wien\"],\"price\":\"€ 1.250,00\","
+        r"\"availability\":\"available\",\"estatesCount\":\"40 Wohnungen\","
+        r"\"roomsRange\":\"1-4 Zimmer\",\"floorSpaceRange\":\"38-115 m²\""
+    )
+
+
+@pytest.fixture
+def sample_projects_html() -> str:
+    """Sample Mischek projects page with Next.js flight data."""
+    project = project_json("Grüne Mitte Floridsdorf")
+    return f"""
+    <html>
+    <head><script src="/_next/static/chunks/main.js"></script></head>
+    <body>
+        <script>self.__next_f.push([1,"{{{project_json("Home")}}}"])</script>
+        <script>self.__next_f.push([1,"{{{project}}}"])</script>
+        <script>self.__next_f.push([1,"{{{project}}}"])</script>
+    </body>
+    </html>
+    """
+
+
+class TestMischekScraper:
+    """Tests for MischekScraper."""
+
+    def test_scrape_projects(self, httpx_mock: HTTPXMock, sample_projects_html: str) -> None:
+        """Test that projects are extracted from the flight data once each."""
+        httpx_mock.add_response(url="https://www.mischek.at/de/projekte", text=sample_projects_html)
+
+        flats = MischekScraper().scrape()
+
+        assert len(flats) == 1
+        flat = flats[0]
+        assert flat.title == "Grüne Mitte Floridsdorf - 40 Wohnungen"
+        assert str(flat.url) == "https://www.mischek.at/de/projekte/gruene-mitte-floridsdorf"
+        assert flat.location == "Donaufelder Straße 101, 1210 Wien"
+        assert flat.price == 1250.0
+        assert flat.size == 76.5
+        assert flat.rooms == 2.5
+        assert sorted(flat.markers) == ["for_sale", "neubau", "subsidized"]
+
+    def test_scrape_without_flight_data(self, httpx_mock: HTTPXMock) -> None:
+        """Test that a page without Next.js data yields no flats."""
+        httpx_mock.add_response(
+            url="https://www.mischek.at/de/projekte", text="<html><body></body></html>"
+        )
+
+        assert MischekScraper().scrape() == []
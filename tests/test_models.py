@@ -59,6 +59,17 @@ class TestFlat:
                 source="test",
             )
 
+    def test_flat_empty_source(self) -> None:
+        """Test Flat validation fails with an empty source."""
+        with pytest.raises(ValidationError):
+            Flat(
+                id="test-123",
+                title="Test",
+                url="https://example.com/flat",  # type: ignore
+                location="Test",
+                source="",
+            )
+
     def test_flat_missing_required_fields(self) -> None:
         """Test Flat validation fails when required fields are missing."""
         with pytest.raises(ValidationError):
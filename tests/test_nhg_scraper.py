@@ -0,0 +1,50 @@
+"""Tests for NHG scraper."""
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from wohnung.scrapers.nhg import NhgScraper
+
+PLANNING_URL = "https://www.nhg.at/immobilienangebot/projekte-in-planung/"
+CONSTRUCTION_URL = "https://www.nhg.at/immobilienangebot/projekte-in-bau/"
+
+
+@pytest.fixture
+def sample_planning_html() -> str:
+    """Sample NHG project list with multi-class items."""
+    return """
+    <html>
+    <body>
+        <nav><div class="item">Menü</div></nav>
+        <div class="item col-md-4" data-url="/projekte/an-der-schanze/">
+            <img src="/uploads/schanze.jpg" />
+            <h6>An der Schanze</h6>
+            <p>1210 Wien, An der Schanze , 1210 Wien, Simone-Veil-Gasse 11</p>
+        </div>
+        <div class="item" data-url="/projekte/ohne-titel/"><p>1100 Wien</p></div>
+    </body>
+    </html>
+    """
+
+
+class TestNhgScraper:
+    """Tests for NhgScraper."""
+
+    def test_scrape_projects(self, httpx_mock: HTTPXMock, sample_planning_html: str) -> None:
+        """Test that project items are parsed and failing pages are reported."""
+        httpx_mock.add_response(url=PLANNING_URL, text=sample_planning_html)
+        httpx_mock.add_response(url=CONSTRUCTION_URL, status_code=500)
+
+        scraper = NhgScraper()
+        flats = scraper.scrape()
+
+        assert len(flats) == 1
+        flat = flats[0]
+        assert flat.title == "An der Schanze"
+        assert str(flat.url) == "https://www.nhg.at/projekte/an-der-schanze/"
+        assert flat.location == "1210 Wien, An der Schanze, Simone-Veil-Gasse 11"
+        assert str(flat.image_url) == "https://www.nhg.at/uploads/schanze.jpg"
+        assert flat.markers == ["in_planning", "subsidized", "for_sale"]
+        status, warnings = scraper.check_health(flats)
+        assert status == "unhealthy"
+        assert any("projekte-in-bau" in warning for warning in warnings)
@@ -0,0 +1,56 @@
+"""Tests for Nordwestbahnhof scraper."""
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from wohnung.scrapers.nordwestbahnhof import NordwestbahnhofScraper
+
+
+@pytest.fixture
+def sample_projects_html() -> str:
+    """Sample construction project page with two development stages."""
+    return """
+    <html>
+    <body>
+        <main>
+            <h2>Bauprojekte</h2>
+            <h3>Entwicklungsstufe I</h3>
+            <p>Geförderter Wohnbau und Gemeindebau</p>
+            <ul>
+                <li>• Bauplatz 4: (Baufeld 12) Bauträger: Familienwohnbau Planung: Architekt A</li>
+                <li>• Bauplatz 5: Bauträger: Heimbau</li>
+            </ul>
+            <h2>Entwicklungsstufe II</h2>
+            <p>Freifinanziert • Bauplatz 7: Bauträger: ARWAG Planung: Studio B</p>
+            <h2>Kontakt</h2>
+            <p>• Bauplatz 9: Bauträger: Niemand</p>
+        </main>
+    </body>
+    </html>
+    """
+
+
+class TestNordwestbahnhofScraper:
+    """Tests for NordwestbahnhofScraper."""
+
+    def test_scrape_assignments(self, httpx_mock: HTTPXMock, sample_projects_html: str) -> None:
+        """Test that each stage's Bauplatz assignments are parsed up to the next h2."""
+        scraper = NordwestbahnhofScraper()
+        httpx_mock.add_response(url=scraper.base_url, text=sample_projects_html)
+
+        flats = scraper.scrape()
+
+        assert [flat.title for flat in flats] == [
+            "Entwicklungsstufe I - Bauplatz 4: Familienwohnbau",
+            "Entwicklungsstufe I - Bauplatz 5: Heimbau",
+            "Entwicklungsstufe II - Bauplatz 7: ARWAG",
+        ]
+        assert [flat.description for flat in flats] == [
+            "Entwicklungsstufe I: Bauplatz 4 wurde an Familienwohnbau vergeben. "
+            "Baufeld: 12 Planung: Architekt A",
+            "Entwicklungsstufe I: Bauplatz 5 wurde an Heimbau vergeben.",
+            "Entwicklungsstufe II: Bauplatz 7 wurde an ARWAG vergeben. Planung: Studio B",
+        ]
+        assert flats[0].markers == ["stufe_i", "nordwestbahnhof", "subsidized", "gemeindebau"]
+        assert flats[2].markers == ["stufe_ii", "nordwestbahnhof", "free_financed"]
+        assert flats[0].id == "nordwestbahnhof-62565bb3f0042947"
@@ -1,10 +1,17 @@
 """Tests for scraper functionality."""
 
+from pathlib import Path
+
+import httpx
 import pytest
+from bs4 import BeautifulSoup
 from pytest_httpx import HTTPXMock
 
+import wohnung.scrapers
+from wohnung.config import settings
 from wohnung.models import Flat
-from wohnung.scrapers import deduplicate_flats
+from wohnung.scrapers import deduplicate_flats, run_all_scrapers
+from wohnung.scrapers.base import BaseScraper, create_http_client
 from wohnung.scrapers.example import ExampleScraper
 
 
@@ -26,6 +33,23 @@ class TestBaseScraper:
         # ID should contain scraper name
         assert id1.startswith("example-")
 
+    def test_generate_id_is_stable(self) -> None:
+        """Test IDs match those already persisted in site storage."""
+        scraper = ExampleScraper()
+
+        assert scraper.generate_id("https://example.com/flat/123") == "example-8eb2c548d6bdad01"
+
+    def test_shared_client_left_open(self) -> None:
+        """Test that a scraper only closes the HTTP client it created itself."""
+        with create_http_client() as shared:
+            with ExampleScraper(shared) as scraper:
+                assert scraper.client is shared
+            assert not shared.is_closed
+
+        with ExampleScraper() as scraper:
+            own = scraper.client
+        assert own.is_closed
+
     @pytest.mark.parametrize(
         "price_str,expected",
         [
@@ -98,6 +122,54 @@ class TestBaseScraper:
         listings = soup.select(".flat-listing")
         assert len(listings) == 2
 
+    def test_fetch_json(self, httpx_mock: HTTPXMock) -> None:
+        """Test fetching and decoding JSON."""
+        httpx_mock.add_response(
+            url="https://example.com/api",
+            json={"list": [{"id": "1", "view": "<p>Wien</p>"}]},
+        )
+
+        scraper = ExampleScraper()
+        data = scraper.fetch_json("https://example.com/api")
+
+        assert data == {"list": [{"id": "1", "view": "<p>Wien</p>"}]}
+
+    def test_fetch_html_many(self, httpx_mock: HTTPXMock, sample_html: str) -> None:
+        """Test fetching several pages keeps URL order and skips failures."""
+        httpx_mock.add_response(url="https://example.com/a", text=sample_html)
+        httpx_mock.add_response(url="https://example.com/missing", status_code=404)
+        httpx_mock.add_response(url="https://example.com/b", text="<p>b</p>")
+
+        scraper = ExampleScraper()
+        pages = scraper.fetch_html_many(
+            ["https://example.com/a", "https://example.com/missing", "https://example.com/b"]
+        )
+
+        assert len(pages) == 3
+        assert pages[0] is not None
+        assert len(pages[0].select(".flat-listing")) == 2
+        assert pages[1] is None
+        assert pages[2] is not None
+        assert pages[2].get_text() == "b"
+
+    def test_fetch_html_many_skips_parse_errors(
+        self, monkeypatch: pytest.MonkeyPatch, sample_html: str
+    ) -> None:
+        """Test that a non-HTTP error on one page only drops that page."""
+        scraper = ExampleScraper()
+
+        def fetch_html(url: str) -> BeautifulSoup:
+            if url.endswith("/broken"):
+                raise ValueError("undecodable page")
+            return BeautifulSoup(sample_html, "lxml")
+
+        monkeypatch.setattr(scraper, "fetch_html", fetch_html)
+
+        pages = scraper.fetch_html_many(["https://example.com/broken", "https://example.com/a"])
+
+        assert pages[0] is None
+        assert pages[1] is not None
+
 
 class TestExampleScraper:
     """Tests for ExampleScraper."""
@@ -160,9 +232,72 @@ class TestExampleScraper:
         assert flats == []
 
 
+class BrokenScraper(ExampleScraper):
+    """Scraper that always raises, for orchestration tests."""
+
+    @property
+    def name(self) -> str:
+        """Scraper identifier."""
+        return "broken"
+
+    def scrape(self) -> list[Flat]:
+        """Fail unconditionally."""
+        raise RuntimeError("site down")
+
+
 class TestScraperOrchestration:
     """Tests for scraper orchestration functions."""
 
+    def test_run_all_scrapers_keeps_registry_order(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        httpx_mock: HTTPXMock,
+        sample_html: str,
+    ) -> None:
+        """Test that parallel runs return one result per scraper in registry order."""
+        httpx_mock.add_response(url="https://example.com/flats", text=sample_html)
+        monkeypatch.setattr(wohnung.scrapers, "SCRAPERS", (BrokenScraper, ExampleScraper))
+        monkeypatch.setattr(settings, "log_dir", tmp_path)
+
+        results = run_all_scrapers()
+
+        assert [r.source for r in results] == ["broken", "example"]
+        assert results[0].health_status == "failed"
+        assert results[0].errors == ["Error running broken: site down"]
+        assert len(results[1].flats) == 2
+        assert (tmp_path / "broken.log").exists()
+        log = (tmp_path / "example.log").read_text(encoding="utf-8")
+        assert log.startswith("scraper:    example\n")
+        assert "status:     HEALTHY\n" in log
+        assert "results:    2 Wohnungen gefunden\n" in log
+        assert (
+            "  [example-8eb2c548d6bdad01] Beautiful 2-Room Apartment | Berlin-Mitte | 1200.0\n"
+            "    https://example.com/flat/123\n"
+        ) in log
+        assert log.endswith("\n")
+
+    def test_run_all_scrapers_reuses_client(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test that runs without explicit scrapers share one open client."""
+        monkeypatch.setattr(wohnung.scrapers, "SCRAPERS", (BrokenScraper,))
+        monkeypatch.setattr(settings, "log_dir", tmp_path)
+        clients: list[httpx.Client | None] = []
+
+        def get_scrapers(client: httpx.Client | None = None) -> list[BaseScraper]:
+            clients.append(client)
+            return [BrokenScraper(client)]
+
+        monkeypatch.setattr(wohnung.scrapers, "get_scrapers", get_scrapers)
+
+        run_all_scrapers()
+        run_all_scrapers()
+
+        assert clients[0] is not None
+        assert clients[0] is clients[1]
+        assert not clients[0].is_closed
+
     def test_deduplicate_flats(self, sample_flats: list[Flat]) -> None:
         """Test deduplication removes duplicates."""
         # Create list with duplicates
@@ -174,6 +309,14 @@ class TestScraperOrchestration:
         assert result[0].id == "test-1"
         assert result[1].id == "test-2"
 
+    def test_deduplicate_keeps_first_occurrence(self, sample_flats: list[Flat]) -> None:
+        """Test deduplication keeps the first flat seen for a duplicated ID."""
+        later = sample_flats[0].model_copy(update={"title": "Later duplicate"})
+
+        result = deduplicate_flats([sample_flats[0], sample_flats[1], later])
+
+        assert result == [sample_flats[0], sample_flats[1]]
+
     def test_deduplicate_empty_list(self) -> None:
         """Test deduplication handles empty list."""
         result = deduplicate_flats([])